@@ -13,10 +13,31 @@ class NetBoxInventoryMonitorConfig(PluginConfig):
     default_settings = {
         # Probe Status Settings
         "probe_recent_days": 7,
+        # Days before warranty/service end reported as expiring
+        "expiry_warning_days": 14,
+        # Full-text search (tsvector) for Asset, Probe and External Inventory "q" filters
+        "search_vector_enabled": False,
+        # Store probe discovered data once per distinct payload
+        "probe_payload_dedup": False,
+        # Hours an item may go unseen within one probe interval, 0 stores a probe per run
+        "probe_interval_max_gap_hours": 0,
+        # Seconds report results are cached for
+        "report_cache_timeout": 3600,
+        # Seconds contract rollup totals are cached for, 0 disables caching
+        "contract_rollup_cache_timeout": 0,
+        # Limits of plugin GraphQL queries, 0 disables a limit
+        "graphql_max_depth": 8,
+        "graphql_max_cost": 50000,
+        "graphql_default_list_size": 1000,
+        "graphql_require_pagination": True,
     }
     required_settings = []
     min_version = "4.4.0"
     max_version = "4.4.99"
 
+    def ready(self):
+        super().ready()
+        from inventory_monitor import events, jobs, signals  # noqa: F401
+
 
 config = NetBoxInventoryMonitorConfig
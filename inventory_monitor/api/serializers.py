@@ -12,6 +12,8 @@ from rest_framework import serializers
 from tenancy.api.serializers import TenantSerializer
 from utilities.api import get_serializer_for_model
 
+from inventory_monitor.helpers import get_assigned_object_content_types
+
 # Local models
 from inventory_monitor.models import (
     ASSIGNED_OBJECT_MODELS_QUERY,
@@ -133,6 +135,24 @@ class ContractSerializer(NetBoxModelSerializer):
 #
 
 
+class AssignedObjectTypeField(ContentTypeField):
+    """
+    ContentTypeField accepting only the assignable content types, resolved from the
+    process-wide registry instead of querying the database on every write
+    """
+
+    def to_internal_value(self, data):
+        try:
+            app_label, model = data.split(".")
+        except (AttributeError, TypeError, ValueError):
+            self.fail("invalid")
+
+        content_type = get_assigned_object_content_types().get(model)
+        if content_type is None or content_type.app_label != app_label:
+            self.fail("does_not_exist", content_type=data)
+        return content_type
+
+
 class AssetSerializer(NetBoxModelSerializer):
     """
     Serializer for Asset objects supporting GenericForeignKey relationships
@@ -144,7 +164,7 @@ class AssetSerializer(NetBoxModelSerializer):
     type = AssetTypeSerializer(nested=True)
 
     # Generic relationship fields
-    assigned_object_type = ContentTypeField(
+    assigned_object_type = AssignedObjectTypeField(
         queryset=ContentType.objects.filter(ASSIGNED_OBJECT_MODELS_QUERY),
         required=False,
         allow_null=True,
@@ -232,6 +252,8 @@ class ProbeSerializer(NetBoxModelSerializer):
     device = DeviceSerializer(allow_null=True, nested=True)
     site = SiteSerializer(allow_null=True, nested=True)
     location = LocationSerializer(allow_null=True, nested=True)
+    # Presented inline also when stored in a shared payload
+    discovered_data = serializers.JSONField(required=False)
 
     class Meta:
         model = Probe
@@ -1,3 +1,4 @@
+from django.urls import path
 from netbox.api.routers import NetBoxRouter
 
 from inventory_monitor.api import views
@@ -14,4 +15,7 @@ router.register("asset-services", views.AssetServiceViewSet)
 router.register("rmas", views.RMAViewSet)
 router.register("external-inventory", views.ExternalInventoryViewSet)
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path("reports/expiry-forecast/", views.ExpiryForecastView.as_view(), name="expiry_forecast"),
+    path("reports/rma-failure-rates/", views.RMAFailureRateView.as_view(), name="rma_failure_rates"),
+]
@@ -1,6 +1,14 @@
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.viewsets import NetBoxModelViewSet
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer
+from rest_framework.views import APIView
 
-from inventory_monitor import filtersets, models
+from inventory_monitor import filtersets, forms, models
 from inventory_monitor.api.serializers import (
     AssetSerializer,
     AssetServiceSerializer,
@@ -13,14 +21,57 @@ from inventory_monitor.api.serializers import (
     RMASerializer,
 )
 from inventory_monitor.filtersets import ExternalInventoryFilterSet
-from inventory_monitor.models import ExternalInventory
+from inventory_monitor.models import ExternalInventory, Probe
+from inventory_monitor.probe_intervals import extend_probe_intervals, get_probe_interval_max_gap
+from inventory_monitor.reports import (
+    get_cached_contract_burndown,
+    get_cached_expiry_forecast,
+    get_cached_rma_failure_rates,
+)
 
 
 class ProbeViewSet(NetBoxModelViewSet):
-    queryset = models.Probe.objects.prefetch_related("tags", "device")
+    queryset = models.Probe.objects.prefetch_related("tags", "device", "payload")
     serializer_class = ProbeSerializer
     filterset_class = filtersets.ProbeFilterSet
 
+    def perform_create(self, serializer):
+        """
+        Create probes, or with probe intervals extend the current interval of their items.
+
+        Probes continuing the current interval of their item (one the user may change)
+        extend it instead of being inserted, as in the probe import (see
+        inventory_monitor.probe_intervals). The response lists the extended and created
+        probes, one probe per interval.
+        """
+        max_gap = get_probe_interval_max_gap()
+        if not max_gap:
+            return super().perform_create(serializer)
+
+        many = isinstance(serializer, ListSerializer)
+        child = serializer.child if many else serializer
+        items = serializer.validated_data if many else [serializer.validated_data]
+
+        attrs_by_probe = {}
+        batch = []
+        for attrs in items:
+            probe = Probe(**{field: value for field, value in attrs.items() if field != "tags"})
+            attrs_by_probe[id(probe)] = attrs
+            batch.append((probe, attrs.get("tags", [])))
+
+        with transaction.atomic():
+            batch, extended = extend_probe_intervals(
+                batch, max_gap, changeable=Probe.objects.restrict(self.request.user, "change")
+            )
+            # Probes inserted earlier in the request may have been extended by later ones
+            created = [child.create({**attrs_by_probe[id(probe)], "time": probe.time}) for probe, _ in batch]
+            created_pks = [probe.pk for probe in created]
+            if Probe.objects.restrict(self.request.user, "add").filter(pk__in=created_pks).count() != len(created):
+                raise PermissionDenied()
+
+        instances = [*Probe.objects.filter(pk__in=extended), *created]
+        serializer.instance = instances if many else instances[0]
+
 
 class ContractorViewSet(NetBoxModelViewSet):
     queryset = models.Contractor.objects.prefetch_related("tags", "tenant")
@@ -33,6 +84,12 @@ class ContractViewSet(NetBoxModelViewSet):
     serializer_class = ContractSerializer
     filterset_class = filtersets.ContractFilterSet
 
+    @action(detail=True, methods=["get"])
+    def burndown(self, request, pk=None):
+        """Monthly invoiced spending of the contract and its subcontracts against the contract price."""
+        invoices = models.Invoice.objects.restrict(request.user, "view")
+        return Response(get_cached_contract_burndown(request.user, self.get_object(), invoices))
+
 
 class InvoiceViewSet(NetBoxModelViewSet):
     queryset = models.Invoice.objects.prefetch_related("tags", "contract")
@@ -68,3 +125,57 @@ class ExternalInventoryViewSet(NetBoxModelViewSet):
     queryset = ExternalInventory.objects.prefetch_related("assets", "tags")
     serializer_class = ExternalInventorySerializer
     filterset_class = ExternalInventoryFilterSet
+
+
+class ExpiryForecastView(APIView):
+    """
+    Monthly forecast of expiring warranties and services.
+
+    Query parameters: group_by (vendor, project or type) and months (1-36).
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def get(self, request):
+        if not request.user.has_perms(("inventory_monitor.view_asset", "inventory_monitor.view_assetservice")):
+            raise PermissionDenied()
+
+        form = forms.ExpiryForecastForm(request.query_params)
+        if not form.is_valid():
+            raise ValidationError(form.errors)
+
+        rows = get_cached_expiry_forecast(
+            request.user,
+            models.Asset.objects.restrict(request.user, "view"),
+            models.AssetService.objects.restrict(request.user, "view"),
+            group_by=form.cleaned_data["group_by"] or "vendor",
+            months=form.cleaned_data["months"] or 12,
+        )
+        return Response(rows)
+
+
+class RMAFailureRateView(APIView):
+    """
+    RMA counts, RMA rate against the installed base and mean days to RMA per vendor,
+    part number and asset type.
+
+    Query parameters: since (count only RMAs issued on or after this date).
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def get(self, request):
+        if not request.user.has_perms(("inventory_monitor.view_asset", "inventory_monitor.view_rma")):
+            raise PermissionDenied()
+
+        form = forms.RMAFailureRateForm(request.query_params)
+        if not form.is_valid():
+            raise ValidationError(form.errors)
+
+        rows = get_cached_rma_failure_rates(
+            request.user,
+            models.Asset.objects.restrict(request.user, "view"),
+            models.RMA.objects.restrict(request.user, "view"),
+            since=form.cleaned_data["since"],
+        )
+        return Response(rows)
@@ -0,0 +1,13 @@
+"""
+Custom event types of Inventory Monitor Plugin.
+
+Registered from NetBoxInventoryMonitorConfig.ready(), so they can be selected in event rules.
+"""
+
+from django.utils.translation import gettext_lazy as _
+from netbox.events import EVENT_TYPE_KIND_WARNING, EventType
+
+# Emitted once per run of ExpiryNotificationJob with all newly expiring warranties and services
+EXPIRY_WARNING = "inventory_monitor.expiry_warning"
+
+EventType(EXPIRY_WARNING, _("Warranty or service expiring"), kind=EVENT_TYPE_KIND_WARNING).register()
@@ -1,9 +1,11 @@
+from datetime import timedelta
+
 import django_filters
 
 # NetBox model imports
 from dcim.models import Device, Location, Rack, Site
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
 from extras.filters import TagFilter
 from netbox.filtersets import NetBoxModelFilterSet
 from utilities.filters import (
@@ -11,7 +13,57 @@ from utilities.filters import (
     MultiValueNumberFilter,
 )
 
-from inventory_monitor.models import Asset, AssetType, Contract, ExternalInventory
+from inventory_monitor.helpers import get_assigned_object_content_types
+from inventory_monitor.models import (
+    Asset,
+    AssetType,
+    Contract,
+    RMA,
+    DateStatusChoices,
+    ExternalInventory,
+    Probe,
+    annotate_date_status,
+)
+from inventory_monitor.search_vectors import search_by_vector
+from inventory_monitor.settings import get_probe_recent_days, get_search_vector_enabled
+
+
+def get_external_inventory_items_exist(prefix="", external_inventory_ids=None):
+    """
+    Build an EXISTS subquery matching assets linked to External Inventory items.
+
+    Args:
+        prefix (str): Lookup path from the filtered model to the asset, e.g. "assets__"
+        external_inventory_ids (list): Only match links to these items (default: any item)
+
+    Returns:
+        Exists: Boolean expression
+    """
+    links = ExternalInventory.assets.through.objects.filter(asset_id=OuterRef(f"{prefix}pk"))
+    if external_inventory_ids is not None:
+        links = links.filter(externalinventory_id__in=external_inventory_ids)
+    return Exists(links)
+
+
+def get_recent_probe_exists(prefix=""):
+    """
+    Build an EXISTS subquery matching assets probed within "probe_recent_days".
+
+    Probes are matched by the asset serial and by the serials of its RMAs, as in Asset.get_related_probes().
+
+    Args:
+        prefix (str): Lookup path from the filtered model to the asset
+
+    Returns:
+        Q: Boolean expression
+    """
+    # Same cut-off as Asset.is_recently_probed(), which compares whole days
+    since = timezone.now() - timedelta(days=get_probe_recent_days() + 1)
+    recent_probes = Probe.objects.filter(time__gt=since)
+    rma_probes = recent_probes.filter(Q(serial=OuterRef("original_serial")) | Q(serial=OuterRef("replacement_serial")))
+    return Q(Exists(recent_probes.filter(serial=OuterRef(f"{prefix}serial")))) | Q(
+        Exists(RMA.objects.filter(asset_id=OuterRef(f"{prefix}pk")).filter(Exists(rma_probes)))
+    )
 
 
 class AssetFilterSet(NetBoxModelFilterSet):
@@ -74,7 +126,7 @@ class AssetFilterSet(NetBoxModelFilterSet):
         label="Order Contract (ID)",
     )
     external_inventory_items = django_filters.ModelMultipleChoiceFilter(
-        field_name="external_inventory_items__id",
+        method="filter_external_inventory_items",
         queryset=ExternalInventory.objects.all(),
         to_field_name="id",
         label="External Inventory (ID)",
@@ -85,6 +137,12 @@ class AssetFilterSet(NetBoxModelFilterSet):
         label="Has External Inventory items",
     )
 
+    stale_probe = django_filters.BooleanFilter(
+        method="filter_stale_probe",
+        label="Stale probe",
+        help_text="Not probed within the configured number of days",
+    )
+
     #
     # Additional information filters
     #
@@ -134,6 +192,11 @@ class AssetFilterSet(NetBoxModelFilterSet):
     warranty_end = django_filters.DateFilter(field_name="warranty_end", lookup_expr="contains")
     warranty_end__gte = django_filters.DateFilter(field_name="warranty_end", lookup_expr="gte")
     warranty_end__lte = django_filters.DateFilter(field_name="warranty_end", lookup_expr="lte")
+    warranty_state = django_filters.MultipleChoiceFilter(
+        choices=DateStatusChoices,
+        method="filter_warranty_state",
+        label="Warranty Status",
+    )
 
     class Meta:
         model = Asset
@@ -151,32 +214,62 @@ class AssetFilterSet(NetBoxModelFilterSet):
             "warranty_start",
             "warranty_end",
             "has_external_inventory_items",
+            "stale_probe",
             "external_inventory_number",
         )
 
+    def filter_external_inventory_items(self, queryset, name, value):
+        """Filter assets linked to any of the given External Inventory items, without joining the links."""
+        return queryset.filter(get_external_inventory_items_exist(external_inventory_ids=[item.pk for item in value]))
+
     def filter_has_external_inventory_items(self, queryset, name, value):
         """
         Filter assets based on whether they have external inventory items.
-        
-        Uses exclude for the false case to avoid join-induced duplicates.
+
+        Uses an EXISTS subquery, so no join (and no DISTINCT) is needed.
         """
         if value is True:
-            return queryset.filter(external_inventory_items__isnull=False).distinct()
+            return queryset.filter(get_external_inventory_items_exist())
+        elif value is False:
+            return queryset.filter(~get_external_inventory_items_exist())
+        else:
+            return queryset
+
+    def filter_stale_probe(self, queryset, name, value):
+        """Filter assets without (True) or with (False) a recent probe."""
+        if value is True:
+            return queryset.exclude(get_recent_probe_exists())
         elif value is False:
-            return queryset.exclude(external_inventory_items__isnull=False)
+            return queryset.filter(get_recent_probe_exists())
         else:
             return queryset
 
+    def filter_warranty_state(self, queryset, name, value):
+        """Filter assets by warranty status bucket, evaluated in SQL."""
+        if not value:
+            return queryset
+        queryset = annotate_date_status(queryset, "warranty_start", "warranty_end", "warranty_state")
+        return queryset.filter(warranty_state__in=value)
+
     def search(self, queryset, name, value):
         """
         Perform global search across multiple fields and related objects
 
         Searches through:
-        - Asset fields (description, serial, project, vendor)
+        - Asset fields (description, serial, partnumber, project, vendor)
         - Related order contract names
         - Assigned objects (devices, sites, locations, racks)
         - External Inventory numbers
 
+        Every source is resolved to a set of asset IDs on its own, so each part
+        can use its trigram index. The parts are combined with UNION, which avoids
+        the row multiplication (and the DISTINCT) of joining all sources at once.
+
+        With "search_vector_enabled", serial, partnumber, description and External
+        Inventory numbers are matched against the full-text search vector instead.
+        The other sources are still matched by substring and combined with the
+        vector match, best vector matches first.
+
         Args:
             queryset: Base queryset to filter
             name: Name of the filter parameter
@@ -185,52 +278,46 @@ class AssetFilterSet(NetBoxModelFilterSet):
         Returns:
             Filtered queryset containing matching assets
         """
+        if not value.strip():
+            return queryset
+
+        vector_enabled = get_search_vector_enabled()
+
         # Basic field searches
-        description_search = Q(description__icontains=value)
-        serial = Q(serial__icontains=value)
-        partnumber = Q(partnumber__icontains=value)
-        project = Q(project__icontains=value)
-        vendor = Q(vendor__icontains=value)
-        order_contract = Q(order_contract__name__icontains=value)
-
-        # Add External Inventory inventory number search
-        external_inventory_number = Q(external_inventory_items__inventory_number__icontains=value)
-
-        # Get content types for assigned object types
-        device_type = ContentType.objects.get_for_model(Device)
-        site_type = ContentType.objects.get_for_model(Site)
-        location_type = ContentType.objects.get_for_model(Location)
-        rack_type = ContentType.objects.get_for_model(Rack)
+        field_query = Q(project__icontains=value) | Q(vendor__icontains=value)
+        if not vector_enabled:
+            field_query |= (
+                Q(description__icontains=value) | Q(serial__icontains=value) | Q(partnumber__icontains=value)
+            )
+        field_ids = Asset.objects.filter(field_query).values("pk")
+
+        # Order contract name search
+        order_contract_ids = Asset.objects.filter(
+            order_contract__in=Contract.objects.filter(name__icontains=value).values("pk")
+        ).values("pk")
+
+        matching_ids = [field_ids.order_by(), order_contract_ids.order_by()]
+
+        if not vector_enabled:
+            # External Inventory inventory number search (through the M2M table, no join with Asset)
+            matching_ids.append(
+                ExternalInventory.assets.through.objects.filter(externalinventory__inventory_number__icontains=value)
+                .values("asset_id")
+                .order_by()
+            )
 
         # Search through assigned objects
-        device_search = Q(
-            assigned_object_type=device_type,
-            assigned_object_id__in=Device.objects.filter(name__icontains=value).values_list("pk", flat=True),
-        )
-        site_search = Q(
-            assigned_object_type=site_type,
-            assigned_object_id__in=Site.objects.filter(name__icontains=value).values_list("pk", flat=True),
-        )
-        location_search = Q(
-            assigned_object_type=location_type,
-            assigned_object_id__in=Location.objects.filter(name__icontains=value).values_list("pk", flat=True),
-        )
-        rack_search = Q(
-            assigned_object_type=rack_type,
-            assigned_object_id__in=Rack.objects.filter(name__icontains=value).values_list("pk", flat=True),
-        )
+        content_types = get_assigned_object_content_types()
+        for model in (Device, Site, Location, Rack):
+            matching_ids.append(
+                Asset.objects.filter(
+                    assigned_object_type=content_types[model._meta.model_name],
+                    assigned_object_id__in=model.objects.filter(name__icontains=value).values("pk"),
+                )
+                .values("pk")
+                .order_by()
+            )
 
-        # Combine all search conditions including External Inventory numbers
-        return queryset.filter(
-            description_search
-            | serial
-            | partnumber
-            | project
-            | vendor
-            | order_contract
-            | external_inventory_number
-            | device_search
-            | site_search
-            | location_search
-            | rack_search
-        ).distinct()
+        if vector_enabled:
+            return search_by_vector(queryset, value, other_ids=matching_ids)
+        return queryset.filter(pk__in=matching_ids[0].union(*matching_ids[1:]))
@@ -3,7 +3,7 @@ from django.db.models import Q
 from extras.filters import TagFilter
 from netbox.filtersets import NetBoxModelFilterSet
 
-from inventory_monitor.models import Asset, AssetService, Contract
+from inventory_monitor.models import Asset, AssetService, Contract, DateStatusChoices, annotate_date_status
 
 
 class AssetServiceFilterSet(NetBoxModelFilterSet):
@@ -23,6 +23,7 @@ class AssetServiceFilterSet(NetBoxModelFilterSet):
         service_end (django_filters.DateFilter): Filter for filtering by service end date.
         service_end__gte (django_filters.DateFilter): Filter for filtering by service end date greater than or equal to a specific value.
         service_end__lte (django_filters.DateFilter): Filter for filtering by service end date less than or equal to a specific value.
+        service_state (django_filters.MultipleChoiceFilter): Filter for filtering by service status (expired, expiring, active, upcoming).
         service_price (django_filters.NumberFilter): Filter for filtering by service price.
         service_price__gte (django_filters.NumberFilter): Filter for filtering by service price greater than or equal to a specific value.
         service_price__lte (django_filters.NumberFilter): Filter for filtering by service price less than or equal to a specific value.
@@ -32,6 +33,7 @@ class AssetServiceFilterSet(NetBoxModelFilterSet):
         contract (django_filters.ModelMultipleChoiceFilter): Filter for filtering by contract.
 
     Methods:
+        filter_service_state(queryset, name, value): Filter by service status bucket, evaluated in SQL.
         search(queryset, name, value): Custom method for searching across multiple fields.
 
     """
@@ -47,6 +49,11 @@ class AssetServiceFilterSet(NetBoxModelFilterSet):
     service_end = django_filters.DateFilter(field_name="service_end", lookup_expr="contains")
     service_end__gte = django_filters.DateFilter(field_name="service_end", lookup_expr="gte")
     service_end__lte = django_filters.DateFilter(field_name="service_end", lookup_expr="lte")
+    service_state = django_filters.MultipleChoiceFilter(
+        choices=DateStatusChoices,
+        method="filter_service_state",
+        label="Service Status",
+    )
     service_price = django_filters.NumberFilter(
         required=False,
         field_name="service_price",
@@ -90,6 +97,24 @@ class AssetServiceFilterSet(NetBoxModelFilterSet):
             "contract",
         )
 
+    def filter_service_state(self, queryset, name, value):
+        """
+        Filter services by service status bucket, evaluated in SQL.
+
+        Args:
+            queryset (QuerySet): The initial queryset.
+            name (str): The name of the field to filter.
+            value (list): Selected DateStatusChoices values.
+
+        Returns:
+            QuerySet: Services in any of the selected buckets.
+
+        """
+        if not value:
+            return queryset
+        queryset = annotate_date_status(queryset, "service_start", "service_end", "service_state")
+        return queryset.filter(service_state__in=value)
+
     def search(self, queryset, name, value):
         """
         Custom method for searching across multiple fields.
@@ -1,8 +1,27 @@
 import django_filters
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from netbox.filtersets import NetBoxModelFilterSet
 
 from inventory_monitor.models import Asset, ExternalInventory
+from inventory_monitor.search_vectors import search_by_vector
+from inventory_monitor.settings import get_search_vector_enabled
+
+
+def get_assets_exist(prefix="", asset_ids=None):
+    """
+    Build an EXISTS subquery matching External Inventory items linked to assets.
+
+    Args:
+        prefix (str): Lookup path from the filtered model to the External Inventory item
+        asset_ids (list): Only match links to these assets (default: any asset)
+
+    Returns:
+        Exists: Boolean expression
+    """
+    links = ExternalInventory.assets.through.objects.filter(externalinventory_id=OuterRef(f"{prefix}pk"))
+    if asset_ids is not None:
+        links = links.filter(asset_id__in=asset_ids)
+    return Exists(links)
 
 
 class ExternalInventoryFilterSet(NetBoxModelFilterSet):
@@ -29,11 +48,10 @@ class ExternalInventoryFilterSet(NetBoxModelFilterSet):
     split_asset = django_filters.CharFilter()
     status = django_filters.CharFilter()
     asset_id = django_filters.ModelMultipleChoiceFilter(
-        field_name="assets",
+        method="filter_asset_id",
         queryset=Asset.objects.all(),
         to_field_name="id",
         label="Asset (ID)",
-        distinct=True,
     )
 
     # Nový filtr pro objekty s/bez přiřazených assetů
@@ -63,10 +81,16 @@ class ExternalInventoryFilterSet(NetBoxModelFilterSet):
             "has_assets",
         ]
 
+    def filter_asset_id(self, queryset, name, value):
+        """Filter External Inventory objects linked to any of the given assets, without joining the links."""
+        return queryset.filter(get_assets_exist(asset_ids=[asset.pk for asset in value]))
+
     def filter_has_assets(self, queryset, name, value):
         """
         Filter External Inventory objects based on whether they have assigned assets.
 
+        Uses an EXISTS subquery, so no join (and no DISTINCT) is needed.
+
         Args:
             queryset: The base queryset
             name: The filter field name
@@ -77,10 +101,10 @@ class ExternalInventoryFilterSet(NetBoxModelFilterSet):
         """
         if value is True:
             # Vrátí pouze External Inventory objekty, které mají alespoň jeden přiřazený asset
-            return queryset.filter(assets__isnull=False).distinct()
+            return queryset.filter(get_assets_exist())
         elif value is False:
             # Vrátí pouze External Inventory objekty, které nemají žádný přiřazený asset
-            return queryset.filter(assets__isnull=True)
+            return queryset.filter(~get_assets_exist())
         else:
             # Pokud value není boolean, vrátí původní queryset
             return queryset
@@ -89,6 +113,8 @@ class ExternalInventoryFilterSet(NetBoxModelFilterSet):
         """Allow searching by various fields using a single search parameter."""
         if value is None or not value.strip():
             return queryset
+        if get_search_vector_enabled():
+            return search_by_vector(queryset, value)
         return queryset.filter(
             Q(inventory_number__icontains=value)
             | Q(name__icontains=value)
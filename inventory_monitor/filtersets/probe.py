@@ -1,10 +1,68 @@
+import json
+
 import django_filters
 from dcim.models import Device
+from django import forms
 from django.db.models import Q
 from extras.filters import TagFilter
 from netbox.filtersets import BaseFilterSet
 
-from inventory_monitor.models import Probe
+from inventory_monitor.models import Probe, ProbePayload
+from inventory_monitor.search_vectors import search_by_vector
+from inventory_monitor.settings import get_search_vector_enabled
+
+
+DISCOVERED_DATA_PATH_PREFIX = "discovered_data__"
+
+
+def get_discovered_data_contains(data, prefix=""):
+    """
+    Build a condition matching probes whose discovered data contains ``data``.
+
+    The data is stored inline or in a shared payload (see ProbePayload), both are matched.
+    Payloads are matched by a subquery, so each side is served by its own GIN index.
+
+    Args:
+        data: JSON value the discovered data must contain
+        prefix (str): Lookup path from the filtered model to the probe
+
+    Returns:
+        Q: Condition
+    """
+    return Q(**{f"{prefix}discovered_data__contains": data}) | Q(
+        **{f"{prefix}payload__in": ProbePayload.objects.filter(discovered_data__contains=data).values("pk")}
+    )
+
+
+def get_discovered_data_path_contains(path, value):
+    """
+    Build a containment condition matching a value at a key path of Probe.discovered_data.
+
+    The value is matched as the given string and, when it spells a JSON number, boolean or
+    null, also as that value, so ``firmware=1.2`` finds both ``"1.2"`` and ``1.2``. Only
+    containment is used, which the jsonb_path_ops GIN index serves.
+
+    Args:
+        path (list): Keys from the top of discovered_data, e.g. ["entity", "firmware"]
+        value (str): Value from the query string
+
+    Returns:
+        Q: Condition
+    """
+    candidates = [value]
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        parsed = value
+    if parsed is None or isinstance(parsed, (bool, int, float)):
+        candidates.append(parsed)
+
+    condition = Q()
+    for candidate in candidates:
+        for key in reversed(path):
+            candidate = {key: candidate}
+        condition |= get_discovered_data_contains(candidate)
+    return condition
 
 
 class ProbeFilterSet(BaseFilterSet):
@@ -24,6 +82,10 @@ class ProbeFilterSet(BaseFilterSet):
         device_id (django_filters.ModelMultipleChoiceFilter): A filter for filtering based on the device ID.
         device (django_filters.ModelMultipleChoiceFilter): A filter for filtering based on the device name.
 
+    Discovered data is filtered with ``discovered_data`` (a JSON object the data must contain)
+    or with key paths, e.g. ``discovered_data__firmware=1.2`` or
+    ``discovered_data__entity__slot=3``. Repeated key paths match any of the values.
+
     Methods:
         search(queryset, name, value): A method for performing a search based on the provided value.
         _latest_only_per_device(queryset, name, value): A method for filtering only the latest inventory per device.
@@ -46,6 +108,12 @@ class ProbeFilterSet(BaseFilterSet):
 
     latest_only = django_filters.BooleanFilter(method="_latest_only", label="Latest inventory")
 
+    discovered_data = django_filters.Filter(
+        field_class=forms.JSONField,
+        method="filter_discovered_data",
+        label="Discovered data (contains JSON)",
+    )
+
     device_id = django_filters.ModelMultipleChoiceFilter(
         field_name="device__id",
         queryset=Device.objects.all(),
@@ -76,6 +144,28 @@ class ProbeFilterSet(BaseFilterSet):
             "category",
         )
 
+    def filter_queryset(self, queryset):
+        """Apply the declared filters, then the discovered_data key path filters of the request."""
+        queryset = super().filter_queryset(queryset)
+
+        for param in self.data:
+            if not param.startswith(DISCOVERED_DATA_PATH_PREFIX):
+                continue
+            path = param[len(DISCOVERED_DATA_PATH_PREFIX) :].split("__")
+            values = self.data.getlist(param) if hasattr(self.data, "getlist") else [self.data[param]]
+            values = [value for value in values if value != ""]
+            if not all(path) or not values:
+                continue
+            condition = Q()
+            for value in values:
+                condition |= get_discovered_data_path_contains(path, value)
+            queryset = queryset.filter(condition)
+
+        return queryset
+
+    def filter_discovered_data(self, queryset, name, value):
+        return queryset.filter(get_discovered_data_contains(value))
+
     def search(self, queryset, name, value):
         """
         Perform a search based on the provided value.
@@ -89,6 +179,9 @@ class ProbeFilterSet(BaseFilterSet):
             QuerySet: The filtered queryset based on the search value.
 
         """
+        if get_search_vector_enabled():
+            return search_by_vector(queryset, value)
+
         device_descriptor = Q(device_descriptor__icontains=value)
         site_descriptor = Q(site_descriptor__icontains=value)
         location_descriptor = Q(location_descriptor__icontains=value)
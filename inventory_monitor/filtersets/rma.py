@@ -5,6 +5,29 @@ from netbox.filtersets import NetBoxModelFilterSet
 from inventory_monitor.models import RMA
 
 
+def get_rma_ids_by_serial(serial, lookup="exact"):
+    """
+    Build a subquery of IDs of RMAs with the given original or replacement serial.
+
+    An OR of the two columns can make the planner scan the table. The UNION of two
+    lookups lets each of them use its own index: the serial indexes for exact
+    lookups, the trigram indexes for icontains.
+
+    Args:
+        serial (str): Serial number
+        lookup (str): Lookup comparing the serial columns to it, "exact" or "icontains"
+
+    Returns:
+        QuerySet: RMA IDs
+    """
+    return (
+        RMA.objects.filter(**{f"original_serial__{lookup}": serial})
+        .order_by()
+        .values("pk")
+        .union(RMA.objects.filter(**{f"replacement_serial__{lookup}": serial}).order_by().values("pk"))
+    )
+
+
 class RMAFilterSet(NetBoxModelFilterSet):
     q = django_filters.CharFilter(method="search")
     rma_number = django_filters.CharFilter()
@@ -44,6 +67,9 @@ class RMAFilterSet(NetBoxModelFilterSet):
         """
         Filter by serial number in either original_serial or replacement_serial fields.
 
+        The serial is matched case-insensitively as a substring, served by the trigram
+        indexes on both columns.
+
         Args:
             queryset: The queryset to filter
             name: The filter field name
@@ -52,6 +78,7 @@ class RMAFilterSet(NetBoxModelFilterSet):
         Returns:
             Filtered queryset matching either original or replacement serial
         """
-        if not value.strip():
+        value = value.strip()
+        if not value:
             return queryset
-        return queryset.filter(Q(original_serial__icontains=value) | Q(replacement_serial__icontains=value))
+        return queryset.filter(pk__in=get_rma_ids_by_serial(value, lookup="icontains"))
@@ -5,6 +5,7 @@ from inventory_monitor.forms.asset import (
     AssetBulkEditForm,
     AssetBulkImportForm,
     AssetExternalInventoryAssignmentForm,
+    AssetFastImportForm,
 )
 
 # Asset Service forms
@@ -40,6 +41,7 @@ from inventory_monitor.forms.external_inventory import (
     ExternalInventoryForm,
     ExternalInventoryBulkEditForm,
     ExternalInventoryFilterForm,
+    ExternalInventorySyncForm,
 )
 
 # Invoice forms
@@ -54,6 +56,13 @@ from inventory_monitor.forms.probe import (
     ProbeForm,
     ProbeFilterForm,
     ProbeDiffForm,
+    ProbeImportForm,
+)
+
+# Report forms
+from inventory_monitor.forms.reports import (
+    ExpiryForecastForm,
+    RMAFailureRateForm,
 )
 
 # RMA forms
@@ -71,6 +80,7 @@ __all__ = [
     "AssetBulkEditForm",
     "AssetBulkImportForm",
     "AssetExternalInventoryAssignmentForm",
+    "AssetFastImportForm",
     # Asset Service forms
     "AssetServiceForm",
     "AssetServiceFilterForm",
@@ -91,6 +101,7 @@ __all__ = [
     "ExternalInventoryForm",
     "ExternalInventoryBulkEditForm",
     "ExternalInventoryFilterForm",
+    "ExternalInventorySyncForm",
     # Invoice forms
     "InvoiceForm",
     "InvoiceFilterForm",
@@ -99,6 +110,10 @@ __all__ = [
     "ProbeForm",
     "ProbeFilterForm",
     "ProbeDiffForm",
+    "ProbeImportForm",
+    # Report forms
+    "ExpiryForecastForm",
+    "RMAFailureRateForm",
     # RMA forms
     "RMAForm",
     "RMAFilterForm",
@@ -1,6 +1,5 @@
 from dcim.models import Device, Location, Module, Rack, Site
 from django import forms
-from django.contrib.contenttypes.models import ContentType
 from django.utils.translation import gettext as _
 from netbox.forms import (
     NetBoxModelBulkEditForm,
@@ -19,9 +18,10 @@ from utilities.forms.rendering import FieldSet, TabbedGroups
 from utilities.forms.widgets.datetime import DatePicker
 
 # Local application imports
-from inventory_monitor.models import Asset, AssetType, Contract, ExternalInventory
+from inventory_monitor.forms.imports import CSVImportForm
+from inventory_monitor.helpers import get_assigned_object_content_type, get_assigned_object_content_types
+from inventory_monitor.models import Asset, AssetType, Contract, DateStatusChoices, ExternalInventory
 from inventory_monitor.models.asset import (
-    ASSIGNED_OBJECT_MODELS_QUERY,
     AssignmentStatusChoices,
     LifecycleStatusChoices,
 )
@@ -209,17 +209,12 @@ class AssetForm(NetBoxModelForm):
 
         if instance:
             # When editing: set the initial value for assigned_object selection
-            for assigned_object_model in ContentType.objects.filter(ASSIGNED_OBJECT_MODELS_QUERY):
-                if type(instance.assigned_object) is assigned_object_model.model_class():
-                    initial[assigned_object_model.model] = instance.assigned_object
-                    break
+            assigned_object = instance.assigned_object
+            if assigned_object is not None and assigned_object._meta.model_name in get_assigned_object_content_types():
+                initial[assigned_object._meta.model_name] = assigned_object
         elif assigned_object_type and assigned_object_id:
             # When adding the Asset from an assigned_object page
-            if (
-                content_type := ContentType.objects.filter(ASSIGNED_OBJECT_MODELS_QUERY)
-                .filter(pk=assigned_object_type)
-                .first()
-            ):
+            if content_type := get_assigned_object_content_type(assigned_object_type):
                 if assigned_object := content_type.model_class().objects.filter(pk=assigned_object_id).first():
                     initial[content_type.model] = assigned_object
 
@@ -285,6 +280,7 @@ class AssetFilterForm(NetBoxModelFilterSetForm):
             "warranty_end",
             "warranty_end__gte",
             "warranty_end__lte",
+            "warranty_state",
             name=_("Warranty Dates"),
         ),
         # Asset information filters
@@ -371,6 +367,7 @@ class AssetFilterForm(NetBoxModelFilterSetForm):
     warranty_end = forms.DateField(required=False, label=("Warranty End"), widget=DatePicker())
     warranty_end__gte = forms.DateField(required=False, label=("Warranty End: From"), widget=DatePicker())
     warranty_end__lte = forms.DateField(required=False, label=("Warranty End: Till"), widget=DatePicker())
+    warranty_state = forms.MultipleChoiceField(choices=DateStatusChoices, required=False, label=_("Warranty Status"))
 
     has_external_inventory_items = forms.ChoiceField(
         choices=[
@@ -527,3 +524,17 @@ class AssetExternalInventoryAssignmentForm(NetBoxModelForm):
                 add_obj.assets.add(instance)
 
         return instance
+
+
+class AssetFastImportForm(CSVImportForm):
+    """
+    Form for the asset bulk import fast path (see inventory_monitor.importers)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["data"].help_text = _(
+            "Columns: serial, partnumber, description, type (ID), assignment_status, lifecycle_status, "
+            "project, vendor, order_contract (name), quantity, price, warranty_start, warranty_end, "
+            "comments, tags (comma-separated slugs)"
+        )
@@ -10,7 +10,7 @@ from utilities.forms.fields import (
 from utilities.forms.rendering import FieldSet
 from utilities.forms.widgets.datetime import DatePicker
 
-from inventory_monitor.models import Asset, AssetService, Contract
+from inventory_monitor.models import Asset, AssetService, Contract, DateStatusChoices
 
 
 class AssetServiceForm(NetBoxModelForm):
@@ -83,6 +83,7 @@ class AssetServiceFilterForm(NetBoxModelFilterSetForm):
             "service_end",
             "service_end__gte",
             "service_end__lte",
+            "service_state",
             name=_("Dates"),
         ),
         FieldSet(
@@ -100,6 +101,7 @@ class AssetServiceFilterForm(NetBoxModelFilterSetForm):
     service_end = forms.DateField(required=False, label=("Service End"), widget=DatePicker())
     service_end__gte = forms.DateField(required=False, label=("Service End: From"), widget=DatePicker())
     service_end__lte = forms.DateField(required=False, label=("Service End: Till"), widget=DatePicker())
+    service_state = forms.MultipleChoiceField(choices=DateStatusChoices, required=False, label=_("Service Status"))
     service_price = forms.DecimalField(
         required=False,
         label="Service Price",
@@ -8,6 +8,7 @@ from utilities.forms.fields import (
 )
 from utilities.forms.rendering import FieldSet
 
+from inventory_monitor.forms.imports import CSVImportForm
 from inventory_monitor.models import Asset, ExternalInventory
 
 
@@ -159,3 +160,16 @@ class ExternalInventoryFilterForm(NetBoxModelFilterSetForm):
         label=_("Has Assets"),
         help_text=_("Filter by whether External Inventory object has assigned assets"),
     )
+
+
+class ExternalInventorySyncForm(CSVImportForm):
+    """
+    Form for synchronizing External Inventory items with an export of the external system
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["data"].help_text = _(
+            "Columns: external_id, inventory_number, name, serial_number, person_id, person_name, location_code, "
+            "location, department_code, project_code, user_name, user_note, split_asset, status"
+        )
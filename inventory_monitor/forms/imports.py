@@ -0,0 +1,34 @@
+from django import forms
+from django.utils.translation import gettext as _
+
+
+class CSVImportForm(forms.Form):
+    """
+    Base form of the bulk import fast path (see inventory_monitor.importers)
+    """
+
+    data = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={"class": "font-monospace", "rows": 12}),
+        label=_("CSV Data"),
+    )
+    upload_file = forms.FileField(required=False, label=_("CSV File"))
+    batch_size = forms.IntegerField(required=False, initial=1000, min_value=1, max_value=10000, label=_("Batch Size"))
+    background_job = forms.BooleanField(
+        required=False,
+        initial=True,
+        label=_("Background job"),
+        help_text=_("Run the import as a background job and follow its progress"),
+    )
+
+    def clean(self):
+        super().clean()
+        if not self.cleaned_data.get("upload_file") and not self.cleaned_data.get("data"):
+            raise forms.ValidationError(_("Provide CSV data or a CSV file."))
+        return self.cleaned_data
+
+    def read_data(self):
+        """Return the CSV text of the uploaded file or the pasted data."""
+        if upload_file := self.cleaned_data.get("upload_file"):
+            return upload_file.read().decode("utf-8-sig")
+        return self.cleaned_data["data"]
@@ -14,6 +14,7 @@ from utilities.forms.fields import (
 from utilities.forms.rendering import FieldSet
 from utilities.forms.widgets.datetime import DatePicker, DateTimePicker
 
+from inventory_monitor.forms.imports import CSVImportForm
 from inventory_monitor.models import Probe
 
 
@@ -52,6 +53,7 @@ class ProbeFilterForm(NetBoxModelFilterSetForm):
         FieldSet("time__gte", "time__lte", name=_("Dates")),
         FieldSet("serial", "category", "device_descriptor", "description", name=_("Common")),
         FieldSet("latest_only_per_device", "latest_only", name=_("Misc")),
+        FieldSet("discovered_data", name=_("Discovered Data")),
     )
 
     tag = TagFilterField(model)
@@ -72,6 +74,11 @@ class ProbeFilterForm(NetBoxModelFilterSetForm):
         label="Latest inventory only",
         widget=forms.Select(choices=BOOLEAN_WITH_BLANK_CHOICES),
     )
+    discovered_data = forms.CharField(
+        required=False,
+        label=_("Contains"),
+        help_text=_('JSON object the discovered data must contain, e.g. {"firmware": "1.2"}'),
+    )
 
 
 class ProbeDiffForm(NetBoxModelForm):
@@ -95,3 +102,17 @@ class ProbeDiffForm(NetBoxModelForm):
     class Meta:
         model = Probe
         fields = ("date_from", "date_to", "device")
+
+
+class ProbeImportForm(CSVImportForm):
+    """
+    Form for the probe bulk import fast path (see inventory_monitor.importers)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["data"].help_text = _(
+            "Columns: name, serial, time, creation_time, part, category, device_descriptor, site_descriptor, "
+            "location_descriptor, device (ID), site (ID), location (ID), discovered_data (JSON), description, "
+            "comments, tags (comma-separated slugs)"
+        )
@@ -0,0 +1,29 @@
+from django import forms
+from django.utils.translation import gettext as _
+from utilities.forms.widgets.datetime import DatePicker
+
+from inventory_monitor.reports import EXPIRY_FORECAST_GROUP_BY, EXPIRY_FORECAST_MAX_MONTHS
+
+
+class ExpiryForecastForm(forms.Form):
+    group_by = forms.ChoiceField(
+        choices=[(key, key.capitalize()) for key in EXPIRY_FORECAST_GROUP_BY],
+        required=False,
+        initial="vendor",
+        label=_("Group By"),
+    )
+    months = forms.IntegerField(
+        required=False,
+        initial=12,
+        min_value=1,
+        max_value=EXPIRY_FORECAST_MAX_MONTHS,
+        label=_("Months"),
+    )
+
+
+class RMAFailureRateForm(forms.Form):
+    since = forms.DateField(
+        required=False,
+        label=_("Issued Since"),
+        widget=DatePicker(),
+    )
@@ -2,8 +2,9 @@ from typing import TYPE_CHECKING, Annotated
 
 import strawberry
 import strawberry_django
+from django.db.models import Q
 from netbox.graphql.filter_mixins import NetBoxModelFilterMixin
-from strawberry.scalars import ID
+from strawberry.scalars import ID, JSON
 from strawberry_django import FilterLookup
 
 if TYPE_CHECKING:
@@ -23,6 +24,9 @@ if TYPE_CHECKING:
         InventoryMonitorRMAStatusEnum,
     )
 
+from inventory_monitor.filtersets.asset import get_external_inventory_items_exist, get_recent_probe_exists
+from inventory_monitor.filtersets.external_inventory import get_assets_exist
+from inventory_monitor.filtersets.probe import get_discovered_data_contains
 from inventory_monitor.models import (
     RMA,
     Asset,
@@ -69,10 +73,15 @@ class InventoryMonitorExternalInventoryFilter(NetBoxModelFilterMixin):
     assets: Annotated["InventoryMonitorAssetFilter", strawberry.lazy("inventory_monitor.graphql.filters")] | None = (
         strawberry_django.filter_field()
     )
-    asset_id: ID | None = strawberry_django.filter_field()
 
-    # Custom filter for has_assets (boolean filter)
-    has_assets: FilterLookup[bool] | None = strawberry_django.filter_field()
+    # Link filters, evaluated as EXISTS subqueries instead of joins
+    @strawberry_django.filter_field()
+    def asset_id(self, value: ID, prefix: str) -> Q:
+        return Q(get_assets_exist(prefix, asset_ids=[value]))
+
+    @strawberry_django.filter_field()
+    def has_assets(self, value: bool, prefix: str) -> Q:
+        return Q(get_assets_exist(prefix)) if value else Q(~get_assets_exist(prefix))
 
 
 @strawberry_django.filter_type(Asset, lookups=True)
@@ -124,10 +133,21 @@ class InventoryMonitorAssetFilter(NetBoxModelFilterMixin):
         Annotated["InventoryMonitorExternalInventoryFilter", strawberry.lazy("inventory_monitor.graphql.filters")]
         | None
     ) = strawberry_django.filter_field()
-    external_inventory_item_id: FilterLookup[ID] | None = strawberry_django.filter_field()
 
-    # Custom boolean filter
-    has_external_inventory_items: FilterLookup[bool] | None = strawberry_django.filter_field()
+    # Link and probe filters, evaluated as EXISTS subqueries instead of joins
+    @strawberry_django.filter_field()
+    def external_inventory_item_id(self, value: ID, prefix: str) -> Q:
+        return Q(get_external_inventory_items_exist(prefix, external_inventory_ids=[value]))
+
+    @strawberry_django.filter_field()
+    def has_external_inventory_items(self, value: bool, prefix: str) -> Q:
+        exists = get_external_inventory_items_exist(prefix)
+        return Q(exists) if value else Q(~exists)
+
+    @strawberry_django.filter_field()
+    def stale_probe(self, value: bool, prefix: str) -> Q:
+        recent_probe = get_recent_probe_exists(prefix)
+        return ~recent_probe if value else recent_probe
 
     # External Inventory number filter (related field)
     external_inventory_number: FilterLookup[str] | None = strawberry_django.filter_field()
@@ -242,6 +262,11 @@ class InventoryMonitorProbeFilter(NetBoxModelFilterMixin):
     )
     location_id: ID | None = strawberry_django.filter_field()
 
+    # Containment only, served by the jsonb_path_ops GIN indexes
+    @strawberry_django.filter_field()
+    def discovered_data(self, value: JSON, prefix: str) -> Q:
+        return get_discovered_data_contains(value, prefix)
+
 
 @strawberry_django.filter_type(RMA, lookups=True)
 class InventoryMonitorRMAFilter(NetBoxModelFilterMixin):
@@ -0,0 +1,123 @@
+"""
+Depth and cost limits of the plugin's GraphQL queries.
+
+The plugin types reference each other in cycles (asset -> order_contract -> assets -> ...),
+so a single query can fetch a very large number of objects. Before a plugin query field
+is resolved, its selection is walked and the query is rejected when:
+
+- object fields are nested deeper than ``graphql_max_depth``,
+- the estimated cost exceeds ``graphql_max_cost``. The cost is the number of objects the
+  query can fetch, where each list counts as its pagination limit, or its ``limit`` argument
+  (``related_probes``), or ``graphql_default_list_size`` when it has neither, times the
+  cost of its items,
+- ``graphql_require_pagination`` is set and a list (a root list like
+  ``inventory_monitor_asset_list`` or a nested relation) is selected without a pagination limit.
+"""
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+)
+from graphql.execution.values import get_argument_values
+from strawberry.extensions.field_extension import FieldExtension
+
+from inventory_monitor.settings import (
+    get_graphql_default_list_size,
+    get_graphql_max_cost,
+    get_graphql_max_depth,
+    get_graphql_require_pagination,
+)
+
+
+def iter_selected_fields(raw_info, parent_type, selection_set):
+    """Yield (field node, field definition) of a selection set, expanding fragments."""
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            fields = getattr(parent_type, "fields", {})
+            if selection.name.value in fields:
+                yield selection, fields[selection.name.value]
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = raw_info.fragments[selection.name.value]
+            fragment_type = raw_info.schema.get_type(fragment.type_condition.name.value)
+            yield from iter_selected_fields(raw_info, fragment_type, fragment.selection_set)
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = parent_type
+            if selection.type_condition:
+                fragment_type = raw_info.schema.get_type(selection.type_condition.name.value)
+            yield from iter_selected_fields(raw_info, fragment_type, selection.selection_set)
+
+
+def get_list_size(raw_info, field_def, node):
+    """Return the pagination (or limit argument) of a list field, or the assumed size if it has none."""
+    limit = None
+    if "pagination" in field_def.args:
+        pagination = get_argument_values(field_def, node, raw_info.variable_values).get("pagination")
+        limit = pagination.get("limit") if isinstance(pagination, dict) else getattr(pagination, "limit", None)
+        if not isinstance(limit, int) or limit < 0:
+            limit = None
+        if limit is None and get_graphql_require_pagination():
+            raise GraphQLError(f"List field '{node.name.value}' requires a pagination limit.")
+    elif "limit" in field_def.args:
+        # Computed lists like related_probes take a limit with a default instead of pagination
+        limit = get_argument_values(field_def, node, raw_info.variable_values).get("limit")
+        if not isinstance(limit, int) or limit < 0:
+            limit = None
+
+    return get_graphql_default_list_size() if limit is None else limit
+
+
+def get_field_depth_and_cost(raw_info, field_def, node, depth):
+    """
+    Walk a selected field and its sub-selections.
+
+    Returns:
+        tuple: (deepest object field depth, estimated number of objects fetched)
+    """
+    if node.selection_set is None:
+        # Scalar and enum fields do not add depth or cost
+        return depth - 1, 0
+
+    max_depth = get_graphql_max_depth()
+    if max_depth and depth > max_depth:
+        raise GraphQLError(f"Query depth exceeds the maximum of {max_depth}.")
+
+    field_type = get_nullable_type(field_def.type)
+    deepest, items_cost = depth, 0
+    for child_node, child_def in iter_selected_fields(raw_info, get_named_type(field_type), node.selection_set):
+        child_depth, child_cost = get_field_depth_and_cost(raw_info, child_def, child_node, depth + 1)
+        deepest = max(deepest, child_depth)
+        items_cost += child_cost
+
+    if is_list_type(field_type):
+        return deepest, get_list_size(raw_info, field_def, node) * (1 + items_cost)
+    return deepest, 1 + items_cost
+
+
+def check_query_limits(info):
+    """Raise a GraphQLError if the selection of the field being resolved exceeds the query limits."""
+    raw_info = info._raw_info
+    field_def = raw_info.parent_type.fields[raw_info.field_name]
+
+    cost = 0
+    for node in raw_info.field_nodes:
+        cost += get_field_depth_and_cost(raw_info, field_def, node, 1)[1]
+
+    max_cost = get_graphql_max_cost()
+    if max_cost and cost > max_cost:
+        raise GraphQLError(
+            f"Estimated query cost {cost} exceeds the maximum of {max_cost}. "
+            "Select fewer nested relations or use smaller pagination limits."
+        )
+
+
+class QueryLimitsExtension(FieldExtension):
+    """Check the query limits before resolving a plugin query field."""
+
+    def resolve(self, next_, source, info, **kwargs):
+        check_query_limits(info)
+        return next_(source, info, **kwargs)
@@ -1,4 +1,5 @@
-from typing import Annotated, List
+from datetime import datetime
+from typing import Annotated, List, Union
 
 import strawberry
 import strawberry_django
@@ -6,12 +7,17 @@ from core.graphql.types import ContentType
 from dcim.graphql.types import (
     DeviceType,
     LocationType,
+    ModuleType,
+    RackType,
     SiteType,
 )
+from django.utils import timezone
 from netbox.graphql.types import NetBoxObjectType
+from strawberry.types import Info
 from tenancy.graphql.types import TenantType
 
 import inventory_monitor.models as models
+from inventory_monitor.settings import get_probe_recent_days
 
 from .enums import (
     InventoryMonitorAssignmentStatusEnum,
@@ -30,9 +36,20 @@ from .filters import (
     InventoryMonitorProbeFilter,
     InventoryMonitorRMAFilter,
 )
+from .hints import (
+    LAST_PROBE_TIME,
+    RELATED_PROBES_LIMIT,
+    get_asset_serials,
+    get_assigned_object,
+    get_assigned_object_prefetch,
+    get_last_probe_time,
+    get_last_probe_time_expression,
+    get_related_probes,
+    get_visible_rmas_prefetch,
+)
 
 
-@strawberry_django.type(models.ExternalInventory, fields="__all__", filters=InventoryMonitorExternalInventoryFilter)
+@strawberry_django.type(models.ExternalInventory, exclude=["search_vector"], filters=InventoryMonitorExternalInventoryFilter, pagination=True)
 class InventoryMonitorExternalInventoryType(NetBoxObjectType):
     external_id: str | None
     inventory_number: str
@@ -53,7 +70,14 @@ class InventoryMonitorExternalInventoryType(NetBoxObjectType):
     assets: List[Annotated["InventoryMonitorAssetType", strawberry.lazy("inventory_monitor.graphql.types")]]
 
 
-@strawberry_django.type(models.Asset, fields="__all__", filters=InventoryMonitorAssetFilter)
+# Object types an Asset can be assigned to, see inventory_monitor.helpers.ASSIGNED_OBJECT_MODELS
+InventoryMonitorAssignedObjectType = Annotated[
+    Union[DeviceType, LocationType, ModuleType, RackType, SiteType],
+    strawberry.union("InventoryMonitorAssignedObjectType"),
+]
+
+
+@strawberry_django.type(models.Asset, exclude=["search_vector"], filters=InventoryMonitorAssetFilter, pagination=True)
 class InventoryMonitorAssetType(NetBoxObjectType):
     # Basic identification fields
     partnumber: str | None
@@ -68,6 +92,13 @@ class InventoryMonitorAssetType(NetBoxObjectType):
     assigned_object_type: Annotated["ContentType", strawberry.lazy("core.graphql.types")] | None
     assigned_object_id: int | None
 
+    # Assigned object, prefetched per content type (see inventory_monitor.graphql.hints)
+    @strawberry_django.field(
+        only=["assigned_object_type", "assigned_object_id"], prefetch_related=[get_assigned_object_prefetch]
+    )
+    def assigned_object(self, info: Info) -> InventoryMonitorAssignedObjectType | None:
+        return get_assigned_object(info, self)
+
     # Related objects
     type: Annotated["InventoryMonitorAssetTypeType", strawberry.lazy("inventory_monitor.graphql.types")] | None
     order_contract: Annotated["InventoryMonitorContractType", strawberry.lazy("inventory_monitor.graphql.types")] | None
@@ -96,8 +127,29 @@ class InventoryMonitorAssetType(NetBoxObjectType):
     # RMAs relationship
     rmas: List[Annotated["InventoryMonitorRMAType", strawberry.lazy("inventory_monitor.graphql.types")]]
 
+    # Probe state, loaded for all assets of a list (see inventory_monitor.graphql.hints)
+    @strawberry_django.field(only=["serial"], prefetch_related=[get_visible_rmas_prefetch])
+    def all_serials(self, info: Info) -> List[str]:
+        return get_asset_serials(info, self)
+
+    @strawberry_django.field(only=["serial"], annotate={LAST_PROBE_TIME: get_last_probe_time_expression})
+    def last_probe_time(self, info: Info) -> datetime | None:
+        return get_last_probe_time(info, self)
 
-@strawberry_django.type(models.AssetType, fields="__all__", filters=InventoryMonitorAssetTypeFilter)
+    @strawberry_django.field(only=["serial"], annotate={LAST_PROBE_TIME: get_last_probe_time_expression})
+    def is_recently_probed(self, info: Info) -> bool:
+        last_probe_time = get_last_probe_time(info, self)
+        return last_probe_time is not None and (timezone.now() - last_probe_time).days <= get_probe_recent_days()
+
+    # Queried per asset, most recent first, at most limit probes
+    @strawberry_django.field(only=["serial"], prefetch_related=[get_visible_rmas_prefetch])
+    def related_probes(
+        self, info: Info, limit: int = RELATED_PROBES_LIMIT
+    ) -> List[Annotated["InventoryMonitorProbeType", strawberry.lazy("inventory_monitor.graphql.types")]]:
+        return get_related_probes(info, self, limit)
+
+
+@strawberry_django.type(models.AssetType, fields="__all__", filters=InventoryMonitorAssetTypeFilter, pagination=True)
 class InventoryMonitorAssetTypeType(NetBoxObjectType):
     name: str
     slug: str
@@ -108,7 +160,7 @@ class InventoryMonitorAssetTypeType(NetBoxObjectType):
     assets: List[Annotated["InventoryMonitorAssetType", strawberry.lazy("inventory_monitor.graphql.types")]]
 
 
-@strawberry_django.type(models.AssetService, fields="__all__", filters=InventoryMonitorAssetServiceFilter)
+@strawberry_django.type(models.AssetService, fields="__all__", filters=InventoryMonitorAssetServiceFilter, pagination=True)
 class InventoryMonitorAssetServiceType(NetBoxObjectType):
     service_start: str | None  # DateField as string
     service_end: str | None  # DateField as string
@@ -122,7 +174,7 @@ class InventoryMonitorAssetServiceType(NetBoxObjectType):
     contract: Annotated["InventoryMonitorContractType", strawberry.lazy("inventory_monitor.graphql.types")] | None
 
 
-@strawberry_django.type(models.Contract, fields="__all__", filters=InventoryMonitorContractFilter)
+@strawberry_django.type(models.Contract, fields="__all__", filters=InventoryMonitorContractFilter, pagination=True)
 class InventoryMonitorContractType(NetBoxObjectType):
     name: str
     name_internal: str
@@ -145,7 +197,7 @@ class InventoryMonitorContractType(NetBoxObjectType):
     invoices: List[Annotated["InventoryMonitorInvoiceType", strawberry.lazy("inventory_monitor.graphql.types")]]
 
 
-@strawberry_django.type(models.Contractor, fields="__all__", filters=InventoryMonitorContractorFilter)
+@strawberry_django.type(models.Contractor, fields="__all__", filters=InventoryMonitorContractorFilter, pagination=True)
 class InventoryMonitorContractorType(NetBoxObjectType):
     name: str
     company: str | None
@@ -159,7 +211,7 @@ class InventoryMonitorContractorType(NetBoxObjectType):
     contracts: List[Annotated["InventoryMonitorContractType", strawberry.lazy("inventory_monitor.graphql.types")]]
 
 
-@strawberry_django.type(models.Invoice, fields="__all__", filters=InventoryMonitorInvoiceFilter)
+@strawberry_django.type(models.Invoice, fields="__all__", filters=InventoryMonitorInvoiceFilter, pagination=True)
 class InventoryMonitorInvoiceType(NetBoxObjectType):
     name: str
     name_internal: str
@@ -173,7 +225,9 @@ class InventoryMonitorInvoiceType(NetBoxObjectType):
     contract: Annotated["InventoryMonitorContractType", strawberry.lazy("inventory_monitor.graphql.types")]
 
 
-@strawberry_django.type(models.Probe, fields="__all__", filters=InventoryMonitorProbeFilter)
+@strawberry_django.type(
+    models.Probe, exclude=["search_vector", "payload"], filters=InventoryMonitorProbeFilter, pagination=True
+)
 class InventoryMonitorProbeType(NetBoxObjectType):
     time: str  # DateTimeField as string
     creation_time: str | None  # DateTimeField as string
@@ -185,7 +239,6 @@ class InventoryMonitorProbeType(NetBoxObjectType):
     serial: str
     description: str
     comments: str
-    discovered_data: str  # JSONField as string
     category: str | None
 
     # DCIM relationships
@@ -193,8 +246,13 @@ class InventoryMonitorProbeType(NetBoxObjectType):
     site: Annotated["SiteType", strawberry.lazy("dcim.graphql.types")] | None
     location: Annotated["LocationType", strawberry.lazy("dcim.graphql.types")] | None
 
+    # Stored inline or in a shared payload, payloads are loaded with one query per list
+    @strawberry_django.field(only=["discovered_data", "payload"], prefetch_related=["payload"])
+    def discovered_data(self) -> str:  # JSONField as string
+        return self.discovered_data
+
 
-@strawberry_django.type(models.RMA, fields="__all__", filters=InventoryMonitorRMAFilter)
+@strawberry_django.type(models.RMA, fields="__all__", filters=InventoryMonitorRMAFilter, pagination=True)
 class InventoryMonitorRMAType(NetBoxObjectType):
     rma_number: str | None
     original_serial: str | None
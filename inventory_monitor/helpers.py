@@ -1,14 +1,167 @@
 import django_tables2
-from core.models import ObjectType
+from core.models import ObjectChange, ObjectType
+from dcim.models import Device, Location, Module, Rack, Site
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db.models import Count
 from utilities.templatetags.builtins.filters import register
 
+# Attempt to import NetBoxAttachment and set a flag based on its availability
+attachments_model_exists = False
+try:
+    from netbox_attachments.models import NetBoxAttachment
+
+    attachments_model_exists = True
+except (ModuleNotFoundError, RuntimeError):
+    pass
+
+# ObjectTypes resolved by get_object_type_or_none(), keyed by (app_label, model)
+_object_types = {}
+
+# Models an Asset can be assigned to, matching ASSIGNED_OBJECT_MODELS_QUERY
+ASSIGNED_OBJECT_MODELS = (Site, Location, Rack, Device, Module)
+
+# ContentTypes of ASSIGNED_OBJECT_MODELS keyed by model name, see get_assigned_object_content_types()
+_assigned_object_content_types = {}
+
 
 def get_object_type_or_none(app_label, model):
-    try:
-        object_type = ObjectType.objects.get(app_label=app_label, model=model)
-        return object_type
-    except Exception:
-        return None
+    """Get an ObjectType, cached for the lifetime of the process.
+
+    Missing object types are not cached, they may be created later by migrations.
+
+    Args:
+        app_label (str): App label of the model
+        model (str): Model name in lowercase
+
+    Returns:
+        ObjectType: ObjectType, or None if it does not exist
+    """
+    key = (app_label, model)
+    if key not in _object_types:
+        try:
+            _object_types[key] = ObjectType.objects.get(app_label=app_label, model=model)
+        except ObjectType.DoesNotExist:
+            return None
+    return _object_types[key]
+
+
+def get_content_type(model):
+    """Get the ContentType of a model class or instance from Django's per-process ContentType cache.
+
+    Args:
+        model: Model class or instance
+
+    Returns:
+        ContentType: ContentType of the model
+    """
+    return ContentType.objects.get_for_model(model)
+
+
+def get_assigned_object_content_types():
+    """Get the ContentTypes of the models an Asset can be assigned to.
+
+    The registry is filled once per process on first use. It is not filled in AppConfig.ready(),
+    where database access is discouraged and the tables may not exist yet.
+
+    Returns:
+        dict: ContentType keyed by model name ("site", "location", "rack", "device", "module")
+    """
+    if not _assigned_object_content_types:
+        content_types = ContentType.objects.get_for_models(*ASSIGNED_OBJECT_MODELS)
+        _assigned_object_content_types.update(
+            {model._meta.model_name: content_types[model] for model in ASSIGNED_OBJECT_MODELS}
+        )
+    return _assigned_object_content_types
+
+
+def get_assigned_object_content_type(pk):
+    """Get an assignable ContentType by its primary key.
+
+    Args:
+        pk (int | str): ContentType ID
+
+    Returns:
+        ContentType: ContentType, or None if it is not an assignable type
+    """
+    for content_type in get_assigned_object_content_types().values():
+        if str(content_type.pk) == str(pk):
+            return content_type
+    return None
+
+
+def get_attachments_counts(model, object_ids):
+    """Count netbox_attachments attachments of the given objects with one grouped query.
+
+    Args:
+        model: Model class of the objects
+        object_ids (list): Primary keys of the objects
+
+    Returns:
+        dict: Attachment count keyed by object ID, objects without attachments are missing
+    """
+    if not attachments_model_exists or not object_ids:
+        return {}
+
+    object_type = get_object_type_or_none(app_label=model._meta.app_label, model=model._meta.model_name)
+    if not object_type:
+        return {}
+
+    return dict(
+        NetBoxAttachment.objects.filter(object_type_id=object_type.pk, object_id__in=object_ids)
+        .values("object_id")
+        .annotate(attachments_count=Count("*"))
+        .values_list("object_id", "attachments_count")
+    )
+
+
+def create_object_changes(objects, action, user, request_id):
+    """Write change log entries for objects saved in bulk, with one query.
+
+    Objects being updated must have been snapshot() before the change. Their tags are
+    part of the logged data, prefetch them to avoid a query per object.
+
+    Args:
+        objects (list): Changed objects
+        action (str): ObjectChangeActionChoices value
+        user (User): User making the change
+        request_id (UUID): ID grouping the change log entries
+    """
+    object_changes = []
+    for obj in objects:
+        object_change = obj.to_objectchange(action)
+        object_change.user = user
+        object_change.user_name = user.username
+        object_change.request_id = request_id
+        object_changes.append(object_change)
+    ObjectChange.objects.bulk_create(object_changes)
+
+
+def prefetch_assigned_objects(queryset):
+    """Prefetch the assigned objects of an Asset queryset.
+
+    The GenericForeignKey is resolved with one query per content type instead of
+    one query per row. Modules are loaded together with their parent device, which
+    is needed for the device serial highlighting in asset tables.
+
+    Args:
+        queryset (QuerySet): Asset queryset
+
+    Returns:
+        QuerySet: Asset queryset with assigned objects prefetched
+    """
+    return queryset.select_related("assigned_object_type").prefetch_related(
+        GenericPrefetch(
+            "assigned_object",
+            [
+                Site.objects.all(),
+                Location.objects.all(),
+                Rack.objects.all(),
+                Device.objects.all(),
+                Module.objects.select_related("device", "module_bay", "module_type"),
+            ],
+        )
+    )
 
 
 @register.filter()
@@ -46,6 +199,28 @@ class NumberColumn(django_tables2.Column):
             return "---"
 
 
+class AttachmentsCountColumn(django_tables2.Column):
+    """Number of netbox_attachments attachments of the row object.
+
+    Counts for all rows of the current table page are fetched with one grouped query
+    when the first cell is rendered.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("empty_values", ())
+        kwargs.setdefault("orderable", False)
+        super().__init__(*args, **kwargs)
+
+    def render(self, record, table):
+        counts = getattr(table, "_attachments_counts", None)
+        if counts is None:
+            rows = table.page.object_list if getattr(table, "page", None) else table.rows
+            counts = table._attachments_counts = get_attachments_counts(
+                table._meta.model, [row.record.pk for row in rows]
+            )
+        return counts.get(record.pk, 0)
+
+
 TEMPLATE_SERVICES_END = """
 {% for service in record.services.all %}
     {% if service.service_end %}
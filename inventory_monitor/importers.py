@@ -0,0 +1,597 @@
+"""
+Bulk import fast path for Inventory Monitor Plugin.
+
+The standard NetBox import validates and saves one object at a time, resolving related
+objects per row. The importers below resolve related objects for the whole file up front,
+then validate the rows batch by batch and write the valid rows of each batch with
+``bulk_create`` (and ``bulk_update`` for the External Inventory sync). Rows with errors are
+reported and skipped, the rest of the file is still imported.
+
+``bulk_create`` does not send ``post_save``, so the importers write what NetBox and the
+plugin would otherwise do per object: change log entries (in bulk), the search cache and
+the full-text search vectors. Event rules (and so webhooks) are not triggered for imported
+objects.
+
+Related objects are looked up among the objects the user may view. As BulkImportView does,
+the written objects of every batch are checked against the user's object permissions
+(constraints included), and a batch with rows outside them is rolled back.
+
+Large files are imported by background jobs (see inventory_monitor.jobs). The uploaded data
+is stored with ``store_import_file()`` and read back by the job, which reports the importer
+progress after every batch.
+"""
+
+import csv
+import io
+import uuid
+
+from core.choices import ObjectChangeActionChoices
+from dcim.models import Device, Location, Site
+from django import forms
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+from extras.models import CustomField, Tag, TaggedItem
+from utilities.exceptions import PermissionsViolation
+
+from inventory_monitor.helpers import create_object_changes, get_content_type
+from inventory_monitor.models import Asset, AssetType, Contract, ExternalInventory, Probe
+from inventory_monitor.models.asset import AssignmentStatusChoices, LifecycleStatusChoices
+from inventory_monitor.models.probe import store_probe_payloads
+from inventory_monitor.probe_intervals import extend_probe_intervals, get_probe_interval_max_gap
+from inventory_monitor.search import cache_search_values
+from inventory_monitor.search_vectors import update_search_vectors
+from inventory_monitor.settings import get_probe_payload_dedup, get_search_vector_enabled
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_FILE_PATH = "inventory_monitor/imports/"
+# Errors kept in the job data, the total count is always reported
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+
+def parse_csv(data):
+    """
+    Parse CSV text into row dicts keyed by lowercase header.
+
+    Args:
+        data (str): CSV text with a header row
+
+    Returns:
+        list: (line number, row dict) tuples
+    """
+    reader = csv.DictReader(io.StringIO(data.strip()))
+    if reader.fieldnames:
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    # Short rows give None values and long rows a None key, normalize both
+    return [
+        (reader.line_num, {key: (value or "").strip() for key, value in row.items() if key is not None})
+        for row in reader
+    ]
+
+
+def store_import_file(upload_file=None, data=None):
+    """
+    Store uploaded or pasted CSV data for a background import job.
+
+    Uploaded files are written to the storage chunk by chunk, without reading them into memory.
+
+    Args:
+        upload_file (UploadedFile): Uploaded CSV file
+        data (str): Pasted CSV text, used when no file is uploaded
+
+    Returns:
+        str: Storage name of the stored file
+    """
+    content = upload_file or ContentFile(data.encode("utf-8"))
+    return default_storage.save(f"{IMPORT_FILE_PATH}{uuid.uuid4().hex}.csv", content)
+
+
+def read_import_file(name):
+    """Read and delete a file stored by store_import_file()."""
+    try:
+        with default_storage.open(name, "rb") as f:
+            return f.read().decode("utf-8-sig")
+    finally:
+        default_storage.delete(name)
+
+
+def format_errors(errors):
+    """Format a form or model error dict as one message."""
+    return "; ".join(f"{field}: {' '.join(messages)}" for field, messages in errors.items())
+
+
+def resolve_by_id(queryset, rows, column):
+    """Fetch the objects referenced by ID in a column of all rows, keyed by the ID string."""
+    ids = {row[column] for _, row in rows if row.get(column, "").isdigit()}
+    return {str(obj.pk): obj for obj in queryset.filter(pk__in=ids)}
+
+
+class BaseImporter:
+    """
+    Base class of the bulk importers.
+
+    Subclasses set ``model`` and ``row_form`` and implement build_object() and save_batch().
+
+    Attributes:
+        total (int): Number of rows passed to run()
+        processed (int): Number of rows validated (and written, when valid) so far
+        created (list): Primary keys of the created objects
+        updated (list): Primary keys of the updated objects
+        errors (list): (line number, message) tuples of rejected rows
+    """
+
+    model = None
+    row_form = None
+
+    def __init__(self, user, request_id=None, batch_size=IMPORT_BATCH_SIZE):
+        self.user = user
+        self.request_id = request_id or uuid.uuid4()
+        self.batch_size = batch_size
+        self.total = 0
+        self.processed = 0
+        self.created = []
+        self.updated = []
+        self.errors = []
+        # Line numbers of the objects of the current batch, by object id()
+        self.lines = {}
+
+    def get_status(self):
+        """Return the progress of the import as JSON-serializable data."""
+        return {
+            "rows": self.total,
+            "processed": self.processed,
+            "created": len(self.created),
+            "updated": len(self.updated),
+            "error_count": len(self.errors),
+            "errors": [[line, message] for line, message in self.errors[:IMPORT_MAX_REPORTED_ERRORS]],
+        }
+
+    def check_columns(self, rows):
+        """Return an error message if the rows use columns the fast path does not support."""
+        if not rows:
+            return None
+        unknown = set(rows[0][1]) - set(self.row_form.base_fields)
+        if unknown:
+            return f"Unsupported columns: {', '.join(sorted(unknown))}. Use the standard import for them."
+
+        required_custom_fields = [
+            cf.name for cf in CustomField.objects.get_for_model(self.model) if cf.required and cf.default is None
+        ]
+        if required_custom_fields:
+            return (
+                f"{self.model._meta.verbose_name_plural.capitalize()} have required custom fields without "
+                f"defaults ({', '.join(required_custom_fields)}). Use the standard import."
+            )
+        return None
+
+    def resolve_related(self, rows):
+        """Resolve tags and custom field defaults for all rows."""
+        tag_slugs = {slug.strip() for _, row in rows for slug in row.get("tags", "").split(",") if slug.strip()}
+        self.tags = {tag.slug: tag for tag in Tag.objects.restrict(self.user, "view").filter(slug__in=tag_slugs)}
+
+        self.custom_field_defaults = {
+            cf.name: cf.default for cf in CustomField.objects.get_for_model(self.model) if cf.default is not None
+        }
+
+    def clean_row(self, line, row):
+        """Validate one row with the row form, returns the cleaned data or None (the error is recorded)."""
+        form = self.row_form(row)
+        if not form.is_valid():
+            self.errors.append((line, format_errors(form.errors)))
+            return None
+        return form.cleaned_data
+
+    def clean_tags(self, line, data):
+        """Pop the tags column from the cleaned data, returns the Tags or None (the error is recorded)."""
+        tag_slugs = [slug.strip() for slug in data.pop("tags", "").split(",") if slug.strip()]
+        if missing_tags := [slug for slug in tag_slugs if slug not in self.tags]:
+            self.errors.append((line, f"tags: unknown tags {', '.join(missing_tags)}"))
+            return None
+        return [self.tags[slug] for slug in tag_slugs]
+
+    def clean_object(self, line, obj):
+        """Validate the model fields of a built object, returns False if invalid (the error is recorded)."""
+        try:
+            obj.clean_fields(exclude=["search_vector"])
+        except forms.ValidationError as e:
+            self.errors.append((line, format_errors(e.message_dict)))
+            return False
+        return True
+
+    def build_object(self, line, row):
+        """
+        Validate one row and build the object to write.
+
+        Returns:
+            tuple: (object, list of Tags), or None if the row is invalid (the error is recorded)
+        """
+        raise NotImplementedError
+
+    def save_batch(self, batch):
+        """Write one batch of (object, list of Tags) tuples."""
+        raise NotImplementedError
+
+    def check_permission(self, objects, action):
+        """
+        Check written objects against the user's object permissions for an action.
+
+        Rows of the objects outside the permitted ones are recorded as errors and
+        PermissionsViolation is raised, which rolls back the batch.
+
+        Args:
+            objects (list): Objects written in the current batch
+            action (str): "add" or "change"
+        """
+        pks = [obj.pk for obj in objects]
+        permitted = set(self.model.objects.restrict(self.user, action).filter(pk__in=pks).values_list("pk", flat=True))
+        denied = [obj for obj in objects if obj.pk not in permitted]
+        if denied:
+            message = f"You do not have permission to {action} this {self.model._meta.verbose_name}"
+            for obj in denied:
+                self.errors.append((self.lines.pop(id(obj), None), message))
+            raise PermissionsViolation
+
+    def run(self, rows, progress=None):
+        """
+        Validate and write the rows in batches.
+
+        Args:
+            rows (list): (line number, row dict) tuples as returned by parse_csv()
+            progress (callable): Called with the importer after every batch
+
+        Returns:
+            BaseImporter: self, with created, updated and errors filled
+        """
+        self.total = len(rows)
+        if error := self.check_columns(rows):
+            self.errors.append((None, error))
+            return self
+
+        self.resolve_related(rows)
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start : start + self.batch_size]
+            valid = [(line, built) for line, row in chunk if (built := self.build_object(line, row))]
+            self.lines = {id(built[0]): line for line, built in valid}
+            if valid:
+                try:
+                    self.save_batch([built for _, built in valid])
+                except PermissionsViolation:
+                    # Rows left in self.lines were valid, but rolled back with the batch
+                    message = "Not imported, the batch contains rows you do not have permission for"
+                    self.errors.extend((line, message) for line in self.lines.values())
+            self.processed += len(chunk)
+            if progress:
+                progress(self)
+
+        return self
+
+    def create_tagged_items(self, objects, batch):
+        """Create the TaggedItems of newly created objects."""
+        content_type = get_content_type(self.model)
+        TaggedItem.objects.bulk_create(
+            [
+                TaggedItem(tag=tag, content_type=content_type, object_id=obj.pk)
+                for obj, (_, tags) in zip(objects, batch)
+                for tag in tags
+            ]
+        )
+
+    def create_object_changes(self, objects, action):
+        """Write the change log entries of the given objects in one query."""
+        create_object_changes(objects, action, self.user, self.request_id)
+
+    def update_search(self, pks):
+        """Refresh the search cache and search vectors of the written objects."""
+        cache_search_values(self.model, pks)
+        if get_search_vector_enabled():
+            update_search_vectors(self.model.objects.filter(pk__in=pks))
+
+
+class AssetImportRowForm(forms.Form):
+    """Validates one CSV row. Related objects are given by name/ID and resolved by the importer."""
+
+    partnumber = forms.CharField(required=False)
+    serial = forms.CharField(required=True)
+    description = forms.CharField(required=False)
+    type = forms.IntegerField(required=False)
+    assignment_status = forms.ChoiceField(choices=AssignmentStatusChoices, required=False)
+    lifecycle_status = forms.ChoiceField(choices=LifecycleStatusChoices, required=False)
+    project = forms.CharField(required=False)
+    vendor = forms.CharField(required=False)
+    order_contract = forms.CharField(required=False)
+    quantity = forms.IntegerField(required=False, min_value=0)
+    price = forms.DecimalField(required=False, min_value=0, decimal_places=2)
+    warranty_start = forms.DateField(required=False)
+    warranty_end = forms.DateField(required=False)
+    comments = forms.CharField(required=False)
+    tags = forms.CharField(required=False)
+
+
+class AssetImporter(BaseImporter):
+    """Import Assets from parsed CSV rows."""
+
+    model = Asset
+    row_form = AssetImportRowForm
+
+    def resolve_related(self, rows):
+        """Resolve contracts, types and tags referenced by all rows with one query each."""
+        super().resolve_related(rows)
+
+        contract_names = {row["order_contract"] for _, row in rows if row.get("order_contract")}
+        self.contracts = {}
+        self.ambiguous_contracts = set()
+        for contract in Contract.objects.restrict(self.user, "view").filter(name__in=contract_names):
+            if contract.name in self.contracts:
+                self.ambiguous_contracts.add(contract.name)
+            self.contracts[contract.name] = contract
+
+        self.types = resolve_by_id(AssetType.objects.restrict(self.user, "view"), rows, "type")
+
+    def build_object(self, line, row):
+        if (data := self.clean_row(line, row)) is None:
+            return None
+
+        contract_name = data.pop("order_contract")
+        if contract_name in self.ambiguous_contracts:
+            self.errors.append((line, f"order_contract: multiple contracts are named {contract_name!r}"))
+            return None
+        if contract_name and contract_name not in self.contracts:
+            self.errors.append((line, f"order_contract: contract {contract_name!r} not found"))
+            return None
+
+        type_id = data.pop("type")
+        if type_id is not None and str(type_id) not in self.types:
+            self.errors.append((line, f"type: asset type {type_id} not found"))
+            return None
+
+        if (tags := self.clean_tags(line, data)) is None:
+            return None
+
+        # Empty columns fall back to the model defaults
+        values = {field: value for field, value in data.items() if value not in (None, "")}
+        asset = Asset(
+            **values,
+            type=self.types.get(str(type_id)),
+            order_contract=self.contracts.get(contract_name),
+            custom_field_data=dict(self.custom_field_defaults),
+        )
+        try:
+            asset.clean_fields(exclude=["assigned_object_type", "search_vector"])
+        except forms.ValidationError as e:
+            self.errors.append((line, format_errors(e.message_dict)))
+            return None
+
+        return asset, tags
+
+    def save_batch(self, batch):
+        """Insert one batch of assets with their tags, change log entries and search data."""
+        with transaction.atomic():
+            assets = Asset.objects.bulk_create([asset for asset, _ in batch])
+            self.create_tagged_items(assets, batch)
+            self.check_permission(assets, "add")
+            # Change log snapshots include tags, load them for the whole batch at once
+            prefetch_related_objects(assets, "tags")
+            self.create_object_changes(assets, ObjectChangeActionChoices.ACTION_CREATE)
+
+            pks = [asset.pk for asset in assets]
+            self.update_search(pks)
+
+        self.created.extend(pks)
+
+
+class ProbeImportRowForm(forms.Form):
+    """Validates one CSV row of probe data. Device, site and location are given by ID."""
+
+    name = forms.CharField(required=True)
+    serial = forms.CharField(required=True)
+    time = forms.DateTimeField(required=True)
+    creation_time = forms.DateTimeField(required=False)
+    part = forms.CharField(required=False)
+    category = forms.CharField(required=False)
+    device_descriptor = forms.CharField(required=False)
+    site_descriptor = forms.CharField(required=False)
+    location_descriptor = forms.CharField(required=False)
+    device = forms.IntegerField(required=False)
+    site = forms.IntegerField(required=False)
+    location = forms.IntegerField(required=False)
+    discovered_data = forms.JSONField(required=False)
+    description = forms.CharField(required=False)
+    comments = forms.CharField(required=False)
+    tags = forms.CharField(required=False)
+
+    def clean(self):
+        super().clean()
+        time, creation_time = self.cleaned_data.get("time"), self.cleaned_data.get("creation_time")
+        if time and creation_time and creation_time > time:
+            raise forms.ValidationError({"creation_time": "Creation time cannot be after probe time."})
+        return self.cleaned_data
+
+
+class ProbeImporter(BaseImporter):
+    """
+    Import Probes from parsed CSV rows.
+
+    Probes are not change logged, so only tags and search data are written along with them.
+    Rows continuing an observation interval extend it instead of adding a probe.
+    """
+
+    model = Probe
+    row_form = ProbeImportRowForm
+    related_models = {"device": Device, "site": Site, "location": Location}
+
+    def resolve_related(self, rows):
+        """Resolve devices, sites, locations and tags referenced by all rows with one query each."""
+        super().resolve_related(rows)
+        self.related = {
+            column: resolve_by_id(model.objects.restrict(self.user, "view"), rows, column)
+            for column, model in self.related_models.items()
+        }
+
+    def build_object(self, line, row):
+        if (data := self.clean_row(line, row)) is None:
+            return None
+
+        for column, model in self.related_models.items():
+            pk = data.pop(column)
+            if pk is not None and str(pk) not in self.related[column]:
+                self.errors.append((line, f"{column}: {model._meta.verbose_name} {pk} not found"))
+                return None
+            data[column] = self.related[column].get(str(pk))
+
+        if (tags := self.clean_tags(line, data)) is None:
+            return None
+
+        values = {field: value for field, value in data.items() if value not in (None, "")}
+        probe = Probe(**values, custom_field_data=dict(self.custom_field_defaults))
+        if not self.clean_object(line, probe):
+            return None
+
+        return probe, tags
+
+    def save_batch(self, batch):
+        """
+        Insert one batch of probes with their tags and search data.
+
+        Probes continuing the current interval of their item extend it instead (see
+        inventory_monitor.probe_intervals), they are counted as updated. Only intervals
+        the user may change are extended.
+        """
+        with transaction.atomic():
+            extended = []
+            if max_gap := get_probe_interval_max_gap():
+                batch, extended = extend_probe_intervals(
+                    batch, max_gap, changeable=Probe.objects.restrict(self.user, "change")
+                )
+
+            if get_probe_payload_dedup():
+                store_probe_payloads([probe for probe, _ in batch])
+            probes = Probe.objects.bulk_create([probe for probe, _ in batch])
+            self.create_tagged_items(probes, batch)
+            self.check_permission(probes, "add")
+
+            pks = [probe.pk for probe in probes]
+            self.update_search(pks)
+
+        self.created.extend(pks)
+        self.updated.extend(extended)
+
+
+class ExternalInventorySyncRowForm(forms.Form):
+    """Validates one CSV row of the external inventory system export."""
+
+    external_id = forms.CharField(required=True, max_length=64)
+    inventory_number = forms.CharField(required=True)
+    name = forms.CharField(required=True)
+    serial_number = forms.CharField(required=False)
+    person_id = forms.CharField(required=False)
+    person_name = forms.CharField(required=False)
+    location_code = forms.CharField(required=False)
+    location = forms.CharField(required=False)
+    department_code = forms.CharField(required=False)
+    project_code = forms.CharField(required=False)
+    user_name = forms.CharField(required=False)
+    user_note = forms.CharField(required=False)
+    split_asset = forms.CharField(required=False)
+    status = forms.CharField(required=False)
+
+
+class ExternalInventorySync(BaseImporter):
+    """
+    Synchronize External Inventory items with an export of the external system.
+
+    Rows are matched to existing items by external ID. New items are created, changed items
+    are updated (empty columns clear the field) and unchanged items are left alone. Items
+    missing from the export are kept. Rows of items the user may not change are rejected.
+    """
+
+    model = ExternalInventory
+    row_form = ExternalInventorySyncRowForm
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unchanged = 0
+
+    def get_status(self):
+        return {**super().get_status(), "unchanged": self.unchanged}
+
+    def resolve_related(self, rows):
+        """Fetch the existing items of all rows the user may change, and the external IDs of the others."""
+        super().resolve_related(rows)
+        self.seen = set()
+        external_ids = {row["external_id"] for _, row in rows if row.get("external_id")}
+        existing = ExternalInventory.objects.filter(external_id__in=external_ids)
+        # Change log snapshots include tags
+        changeable = existing.restrict(self.user, "change").prefetch_related("tags")
+        self.existing = {item.external_id: item for item in changeable}
+        self.protected = set(existing.values_list("external_id", flat=True)) - set(self.existing)
+
+    def build_object(self, line, row):
+        if (data := self.clean_row(line, row)) is None:
+            return None
+
+        external_id = data["external_id"]
+        if external_id in self.seen:
+            self.errors.append((line, f"external_id: {external_id!r} is listed more than once"))
+            return None
+        self.seen.add(external_id)
+        if external_id in self.protected:
+            self.errors.append((line, f"external_id: you do not have permission to change item {external_id!r}"))
+            return None
+
+        # The export is the source of truth, empty columns clear the field
+        values = {field: value or None for field, value in data.items()}
+        item = self.existing.get(external_id)
+        if item is None:
+            item = ExternalInventory(**values, custom_field_data=dict(self.custom_field_defaults))
+        else:
+            if all(getattr(item, field) == value for field, value in values.items()):
+                self.unchanged += 1
+                return None
+            item.snapshot()
+            for field, value in values.items():
+                setattr(item, field, value)
+
+        if not self.clean_object(line, item):
+            return None
+
+        return item, []
+
+    def save_batch(self, batch):
+        """Insert new and update changed items with their change log entries and search data."""
+        new_items = [item for item, _ in batch if item.pk is None]
+        changed_items = [item for item, _ in batch if item.pk is not None]
+
+        with transaction.atomic():
+            created = ExternalInventory.objects.bulk_create(new_items)
+            self.check_permission(created, "add")
+            prefetch_related_objects(created, "tags")
+            self.create_object_changes(created, ObjectChangeActionChoices.ACTION_CREATE)
+
+            now = timezone.now()
+            for item in changed_items:
+                item.last_updated = now
+            ExternalInventory.objects.bulk_update(
+                changed_items, [*ExternalInventorySyncRowForm.base_fields, "last_updated"]
+            )
+            self.check_permission(changed_items, "change")
+            self.create_object_changes(changed_items, ObjectChangeActionChoices.ACTION_UPDATE)
+
+            created_pks = [item.pk for item in created]
+            updated_pks = [item.pk for item in changed_items]
+            self.update_search(created_pks + updated_pks)
+
+            # Inventory numbers are part of the search data of linked assets
+            asset_ids = list(
+                ExternalInventory.assets.through.objects.filter(externalinventory_id__in=updated_pks)
+                .values_list("asset_id", flat=True)
+                .distinct()
+            )
+            if asset_ids:
+                cache_search_values(Asset, asset_ids)
+                if get_search_vector_enabled():
+                    update_search_vectors(Asset.objects.filter(pk__in=asset_ids))
+
+        self.created.extend(created_pks)
+        self.updated.extend(updated_pks)
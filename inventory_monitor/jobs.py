@@ -0,0 +1,180 @@
+"""
+Background jobs of Inventory Monitor Plugin.
+
+System jobs are registered when this module is imported from NetBoxInventoryMonitorConfig.ready().
+Import jobs are enqueued by the import views (see inventory_monitor.views.imports).
+"""
+
+from datetime import timedelta
+
+from core.choices import JobIntervalChoices, JobStatusChoices
+from core.models import Job, ObjectType
+from django.utils import timezone
+from extras.choices import EventRuleActionChoices
+from extras.events import process_event_rules
+from extras.models import EventRule
+from netbox.jobs import JobRunner, system_job
+
+from inventory_monitor.events import EXPIRY_WARNING
+from inventory_monitor.importers import (
+    IMPORT_BATCH_SIZE,
+    AssetImporter,
+    ExternalInventorySync,
+    ProbeImporter,
+    parse_csv,
+    read_import_file,
+)
+from inventory_monitor.models import Asset, AssetService, Probe
+from inventory_monitor.probe_intervals import (
+    compact_probe_intervals,
+    get_probe_interval_max_gap,
+    iter_compaction_batches,
+)
+from inventory_monitor.settings import get_expiry_warning_days
+
+
+@system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
+class ExpiryNotificationJob(JobRunner):
+    """
+    Notify about warranties and services entering the expiry warning window.
+
+    Every run selects, with one range query on the indexed end date per model, the assets
+    and services whose end date entered the window since the previous completed run, and
+    sends them in a single "inventory_monitor.expiry_warning" event to the enabled webhook
+    event rules for Asset objects.
+    """
+
+    class Meta:
+        name = "Inventory Monitor expiry notification"
+
+    def get_window(self, warning_days):
+        """Return the (exclusive start, inclusive end) end-date window crossed since the previous run."""
+        today = timezone.now().date()
+        window_end = today + timedelta(days=warning_days)
+
+        previous_run = (
+            Job.objects.filter(name=self.name, status=JobStatusChoices.STATUS_COMPLETED)
+            .exclude(pk=self.job.pk)
+            .order_by("-completed")
+            .first()
+        )
+        if previous_run is None:
+            # First run reports everything already inside the window
+            return today - timedelta(days=1), window_end
+
+        previous_end = timezone.localdate(previous_run.completed) + timedelta(days=warning_days)
+        return min(previous_end, window_end), window_end
+
+    def run(self, *args, **kwargs):
+        warning_days = get_expiry_warning_days()
+        window_start, window_end = self.get_window(warning_days)
+
+        assets = Asset.objects.filter(warranty_end__gt=window_start, warranty_end__lte=window_end).values(
+            "id", "serial", "partnumber", "vendor", "project", "warranty_end"
+        )
+        services = AssetService.objects.filter(service_end__gt=window_start, service_end__lte=window_end).values(
+            "id", "asset_id", "contract_id", "service_category", "service_category_vendor", "service_end"
+        )
+
+        data = {
+            "warning_days": warning_days,
+            "window_start": (window_start + timedelta(days=1)).isoformat(),
+            "window_end": window_end.isoformat(),
+            "assets": [{**asset, "warranty_end": asset["warranty_end"].isoformat()} for asset in assets],
+            "services": [{**service, "service_end": service["service_end"].isoformat()} for service in services],
+        }
+        self.job.data = {
+            "window_start": data["window_start"],
+            "window_end": data["window_end"],
+            "assets": len(data["assets"]),
+            "services": len(data["services"]),
+        }
+
+        if not data["assets"] and not data["services"]:
+            return
+
+        object_type = ObjectType.objects.get_for_model(Asset)
+        event_rules = EventRule.objects.filter(
+            enabled=True,
+            event_types__contains=[EXPIRY_WARNING],
+            object_types=object_type,
+            action_type=EventRuleActionChoices.WEBHOOK,
+        )
+        process_event_rules(event_rules, object_type, EXPIRY_WARNING, data)
+
+
+@system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
+class ProbeCompactionJob(JobRunner):
+    """
+    Collapse probes stored one per collector run into observation intervals.
+
+    Only serials with probes added since the previous completed run are compacted (all
+    serials on the first run), in batches of serials (see inventory_monitor.probe_intervals).
+    """
+
+    class Meta:
+        name = "Inventory Monitor probe compaction"
+
+    def run(self, *args, **kwargs):
+        max_gap = get_probe_interval_max_gap()
+        if max_gap is None:
+            return
+
+        previous_run = (
+            Job.objects.filter(name=self.name, status=JobStatusChoices.STATUS_COMPLETED)
+            .exclude(pk=self.job.pk)
+            .order_by("-completed")
+            .first()
+        )
+        last_pk = ((previous_run and previous_run.data) or {}).get("last_pk", 0)
+        max_pk = Probe.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+        extended = merged = 0
+        for serials in iter_compaction_batches(Probe.objects.filter(pk__gt=last_pk, pk__lte=max_pk)):
+            batch_extended, batch_merged = compact_probe_intervals(serials, max_gap)
+            extended += batch_extended
+            merged += batch_merged
+
+        self.job.data = {"last_pk": max_pk, "extended": extended, "merged": merged}
+
+
+class ImportJob(JobRunner):
+    """
+    Run a bulk importer over a CSV file stored by inventory_monitor.importers.store_import_file().
+
+    The importer status (rows processed, objects written and errors so far) is saved to the
+    job data after every batch, so the import page can follow the progress.
+    """
+
+    importer_class = None
+
+    def save_progress(self, importer):
+        self.job.data = importer.get_status()
+        self.job.save(update_fields=["data"])
+
+    def run(self, file_name, batch_size=IMPORT_BATCH_SIZE, request_id=None, *args, **kwargs):
+        rows = parse_csv(read_import_file(file_name))
+        importer = self.importer_class(self.job.user, request_id=request_id, batch_size=batch_size)
+        importer.run(rows, progress=self.save_progress)
+        self.job.data = importer.get_status()
+
+
+class AssetImportJob(ImportJob):
+    importer_class = AssetImporter
+
+    class Meta:
+        name = "Inventory Monitor asset import"
+
+
+class ProbeImportJob(ImportJob):
+    importer_class = ProbeImporter
+
+    class Meta:
+        name = "Inventory Monitor probe import"
+
+
+class ExternalInventorySyncJob(ImportJob):
+    importer_class = ExternalInventorySync
+
+    class Meta:
+        name = "Inventory Monitor external inventory sync"
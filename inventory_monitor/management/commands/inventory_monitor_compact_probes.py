@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory_monitor.models import Probe
+from inventory_monitor.probe_intervals import (
+    COMPACTION_BATCH_SIZE,
+    compact_probe_intervals,
+    get_probe_interval_max_gap,
+    iter_compaction_batches,
+)
+
+
+class Command(BaseCommand):
+    help = "Collapse Probes stored one per collector run into observation intervals"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=COMPACTION_BATCH_SIZE,
+            help=f"Number of serials compacted per batch (default: {COMPACTION_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        max_gap = get_probe_interval_max_gap()
+        if max_gap is None:
+            raise CommandError("Probe intervals are disabled (probe_interval_max_gap_hours is 0)")
+
+        extended = merged = 0
+        for serials in iter_compaction_batches(Probe.objects.all(), options["batch_size"]):
+            batch_extended, batch_merged = compact_probe_intervals(serials, max_gap)
+            extended += batch_extended
+            merged += batch_merged
+
+        self.stdout.write(f"{merged} probes merged, {extended} intervals extended")
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from inventory_monitor.models import Probe, ProbePayload
+from inventory_monitor.models.probe import store_probe_payloads
+
+
+class Command(BaseCommand):
+    help = "Move the discovered data stored inline in Probes to shared payloads and delete unused payloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of probes moved per batch (default: 5000)",
+        )
+        parser.add_argument(
+            "--prune-only",
+            action="store_true",
+            help="Only delete payloads no probe references",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        moved = 0
+        last_pk = 0
+        while not options["prune_only"]:
+            probes = list(
+                Probe.objects.filter(pk__gt=last_pk, discovered_data__isnull=False)
+                .exclude(discovered_data={})
+                .order_by("pk")
+                .only("pk", "discovered_data", "payload")[:batch_size]
+            )
+            if not probes:
+                break
+
+            with transaction.atomic():
+                store_probe_payloads(probes)
+                Probe.objects.bulk_update(probes, ["discovered_data", "payload"])
+            moved += len(probes)
+            last_pk = probes[-1].pk
+
+        if not options["prune_only"]:
+            self.stdout.write(f"{moved} probes moved to payloads")
+
+        deleted, _ = ProbePayload.objects.filter(~Exists(Probe.objects.filter(payload=OuterRef("pk")))).delete()
+        self.stdout.write(f"{deleted} unused payloads deleted")
@@ -0,0 +1,67 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from inventory_monitor.search import cache_search_values, get_plugin_indexers
+
+
+def reindex_batch(label, pks):
+    """Rebuild the cached search values of one batch of objects (runs in worker processes)."""
+    return cache_search_values(apps.get_model(label), pks)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cached search values of Inventory Monitor objects in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help="Model names to reindex, e.g. asset probe (default: all plugin models)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Number of objects reindexed per batch (default: 2000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes reindexing batches in parallel (default: 1)",
+        )
+
+    def handle(self, *args, **options):
+        indexers = get_plugin_indexers()
+        labels = list(indexers)
+        if options["models"]:
+            labels = [f"inventory_monitor.{name.lower()}" for name in options["models"]]
+            if unknown := [label for label in labels if label not in indexers]:
+                raise CommandError(f"No search index registered for: {', '.join(unknown)}")
+
+        batch_size = options["batch_size"]
+        batches = []
+        for label in labels:
+            pks = list(apps.get_model(label).objects.order_by("pk").values_list("pk", flat=True))
+            batches.extend((label, pks[i : i + batch_size]) for i in range(0, len(pks), batch_size))
+
+        totals = dict.fromkeys(labels, 0)
+        if options["workers"] > 1:
+            # Forked workers must not share the parent's database connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["workers"], mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                futures = {executor.submit(reindex_batch, label, pks): label for label, pks in batches}
+                for future in as_completed(futures):
+                    totals[futures[future]] += future.result()
+        else:
+            for label, pks in batches:
+                totals[label] += reindex_batch(label, pks)
+
+        for label, total in totals.items():
+            self.stdout.write(f"{label}: {total} cached values written")
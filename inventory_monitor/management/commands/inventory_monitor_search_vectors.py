@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from inventory_monitor.search_vectors import SEARCH_VECTORS, update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search vectors of Assets, Probes and External Inventory items"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Number of objects updated per UPDATE statement (default: 10000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model in SEARCH_VECTORS:
+            updated = 0
+            last_pk = 0
+            while True:
+                pks = list(
+                    model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size]
+                )
+                if not pks:
+                    break
+                updated += update_search_vectors(model.objects.filter(pk__in=pks))
+                last_pk = pks[-1]
+
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {updated} search vectors updated")
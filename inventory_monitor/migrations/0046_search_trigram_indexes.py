@@ -0,0 +1,79 @@
+# Generated by Django 5.2.5 on 2026-10-19 09:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0045_normalize_database_object_names"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("serial"), name="gin_trgm_ops"
+                ),
+                name="invmon_asset_serial_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("partnumber"), name="gin_trgm_ops"
+                ),
+                name="invmon_asset_partnum_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("description"), name="gin_trgm_ops"
+                ),
+                name="invmon_asset_desc_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("project"), name="gin_trgm_ops"
+                ),
+                name="invmon_asset_project_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("vendor"), name="gin_trgm_ops"
+                ),
+                name="invmon_asset_vendor_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contract",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="invmon_contract_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="externalinventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("inventory_number"), name="gin_trgm_ops"
+                ),
+                name="ext_inv_invnum_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-19 09:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0046_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asset",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="externalinventory",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="probe",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="invmon_asset_fts_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="externalinventory",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="ext_inv_fts_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="probe",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="invmon_probe_fts_idx"),
+        ),
+    ]
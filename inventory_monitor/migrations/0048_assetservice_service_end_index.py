@@ -0,0 +1,16 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0047_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assetservice",
+            index=models.Index(fields=["service_end"], name="invmon_service_end_idx"),
+        ),
+    ]
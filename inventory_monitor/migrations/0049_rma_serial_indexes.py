@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0048_assetservice_service_end_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rma",
+            index=models.Index(fields=["original_serial"], name="invmon_rma_orig_serial_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rma",
+            index=models.Index(fields=["replacement_serial"], name="invmon_rma_repl_serial_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0049_rma_serial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="probe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["discovered_data"], name="invmon_probe_data_gin_idx", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
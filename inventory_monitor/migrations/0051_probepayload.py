@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:20
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+import inventory_monitor.models.probe
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0050_probe_discovered_data_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProbePayload",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("hash", models.CharField(editable=False, max_length=64, unique=True)),
+                ("discovered_data", models.JSONField(default=dict)),
+            ],
+            options={
+                "verbose_name": "Probe payload",
+                "verbose_name_plural": "Probe payloads",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["discovered_data"], name="invmon_payload_data_gin_idx", opclasses=["jsonb_path_ops"]
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="probe",
+            name="payload",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="probes",
+                to="inventory_monitor.probepayload",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="probe",
+            name="discovered_data",
+            field=inventory_monitor.models.probe.PayloadJSONField(blank=True, default=dict, null=True),
+        ),
+    ]
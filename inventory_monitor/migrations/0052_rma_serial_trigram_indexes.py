@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory_monitor", "0051_probepayload"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rma",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("original_serial"), name="gin_trgm_ops"
+                ),
+                name="invmon_rma_orig_serial_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rma",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("replacement_serial"), name="gin_trgm_ops"
+                ),
+                name="invmon_rma_repl_serial_trgm",
+            ),
+        ),
+    ]
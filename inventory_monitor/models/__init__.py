@@ -39,12 +39,16 @@ from inventory_monitor.models.invoice import (
 
 # Mixins
 from inventory_monitor.models.mixins import (
+    DateStatusChoices,
     DateStatusMixin,
+    annotate_date_status,
+    get_date_status_order,
 )
 
 # Probe models
 from inventory_monitor.models.probe import (
     Probe,
+    ProbePayload,
 )
 
 # RMA models
@@ -74,9 +78,13 @@ __all__ = [
     # Invoice models
     "Invoice",
     # Mixins
+    "DateStatusChoices",
     "DateStatusMixin",
+    "annotate_date_status",
+    "get_date_status_order",
     # Probe models
     "Probe",
+    "ProbePayload",
     # RMA models
     "RMAStatusChoices",
     "RMA",
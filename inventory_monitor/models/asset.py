@@ -1,7 +1,10 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils import timezone
 from netbox.models import ImageAttachmentsMixin, NetBoxModel
@@ -156,6 +159,9 @@ class Asset(NetBoxModel, DateStatusMixin, ImageAttachmentsMixin):
     #
     comments = models.TextField(blank=True)
 
+    # Full-text search vector, maintained only when "search_vector_enabled" is set
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
     class Meta:
         db_table = "inventory_monitor_asset"
         ordering = (
@@ -184,6 +190,13 @@ class Asset(NetBoxModel, DateStatusMixin, ImageAttachmentsMixin):
                 fields=["assigned_object_type", "assigned_object_id"],
                 name="invmon_asset_assigned_obj_idx",
             ),
+            # Trigram indexes backing the case-insensitive substring search (AssetFilterSet.search)
+            GinIndex(OpClass(Upper("serial"), name="gin_trgm_ops"), name="invmon_asset_serial_trgm"),
+            GinIndex(OpClass(Upper("partnumber"), name="gin_trgm_ops"), name="invmon_asset_partnum_trgm"),
+            GinIndex(OpClass(Upper("description"), name="gin_trgm_ops"), name="invmon_asset_desc_trgm"),
+            GinIndex(OpClass(Upper("project"), name="gin_trgm_ops"), name="invmon_asset_project_trgm"),
+            GinIndex(OpClass(Upper("vendor"), name="gin_trgm_ops"), name="invmon_asset_vendor_trgm"),
+            GinIndex(fields=["search_vector"], name="invmon_asset_fts_idx"),
         ]
 
     def get_related_probes(self):
@@ -262,6 +275,9 @@ class Asset(NetBoxModel, DateStatusMixin, ImageAttachmentsMixin):
             return ", ".join(numbers)
 
     def get_external_inventory_asset_numbers_for_search(self):
+        # Precomputed for a whole batch of assets by the inventory_monitor_reindex command
+        if hasattr(self, "external_inventory_numbers_for_search"):
+            return self.external_inventory_numbers_for_search
         return " ".join(self.get_external_inventory_asset_numbers())
 
     def __str__(self):
@@ -283,4 +299,4 @@ class Asset(NetBoxModel, DateStatusMixin, ImageAttachmentsMixin):
 
     def get_warranty_status(self):
         """Returns the warranty status and color for progress bar"""
-        return self.get_date_status("warranty_start", "warranty_end", "Warranty")
+        return self.get_date_status("warranty_start", "warranty_end", "Warranty", state_field="warranty_state")
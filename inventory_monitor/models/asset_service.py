@@ -55,6 +55,9 @@ class AssetService(NetBoxModel, DateStatusMixin):
             "asset",
             "contract",
         )
+        indexes = [
+            models.Index(fields=["service_end"], name="invmon_service_end_idx"),
+        ]
 
     def __str__(self):
         return f"{self.pk}"
@@ -64,4 +67,4 @@ class AssetService(NetBoxModel, DateStatusMixin):
 
     def get_service_status(self):
         """Returns the service status and color for progress bar"""
-        return self.get_date_status("service_start", "service_end", "Service")
+        return self.get_date_status("service_start", "service_end", "Service", state_field="service_state")
@@ -1,6 +1,8 @@
 from django.core.exceptions import ValidationError
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from netbox.models import NetBoxModel
 from utilities.choices import ChoiceSet
@@ -82,6 +84,9 @@ class Contract(NetBoxModel):
             "invoicing_start",
             "invoicing_end",
         )
+        indexes = [
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="invmon_contract_name_trgm"),
+        ]
 
     def __str__(self):
         if self.parent:
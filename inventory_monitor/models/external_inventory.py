@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from netbox.models import NetBoxModel
 
@@ -115,6 +118,9 @@ class ExternalInventory(NetBoxModel):
         help_text="Associated internal asset records",
     )
 
+    # Full-text search vector, maintained only when "search_vector_enabled" is set
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
     class Meta:
         ordering = ("inventory_number", "name")
         verbose_name = "External Inventory Item"
@@ -127,6 +133,8 @@ class ExternalInventory(NetBoxModel):
             models.Index(fields=["department_code"], name="ext_inv_deptcode_idx"),
             models.Index(fields=["project_code"], name="ext_inv_projcode_idx"),
             models.Index(fields=["status"], name="ext_inv_status_idx"),
+            GinIndex(OpClass(Upper("inventory_number"), name="gin_trgm_ops"), name="ext_inv_invnum_trgm"),
+            GinIndex(fields=["search_vector"], name="ext_inv_fts_idx"),
         ]
         # unique_together = [["inventory_number"]]
 
@@ -1,10 +1,142 @@
+from datetime import timedelta
+
+from django.db.models import Case, CharField, F, IntegerField, Q, Value, When
 from django.utils import timezone
+from utilities.choices import ChoiceSet
+
+from inventory_monitor.settings import get_expiry_warning_days
+
+# Ranges of this many days or less are reported as expiring for their whole duration
+DATE_STATUS_SHORT_DURATION_DAYS = 2
+
+
+class DateStatusChoices(ChoiceSet):
+    key = "inventory_monitor.date_status"
+
+    EXPIRED = "expired"
+    EXPIRING = "expiring"
+    ACTIVE = "active"
+    UPCOMING = "upcoming"
+
+    CHOICES = [
+        (EXPIRED, "Expired", "red"),
+        (EXPIRING, "Expiring", "orange"),
+        (ACTIVE, "Active", "green"),
+        (UPCOMING, "Upcoming", "blue"),
+    ]
+
+
+# Progress bar colors of the date status buckets
+DATE_STATUS_COLORS = {
+    DateStatusChoices.EXPIRED: "danger",
+    DateStatusChoices.EXPIRING: "warning",
+    DateStatusChoices.ACTIVE: "success",
+    DateStatusChoices.UPCOMING: "info",
+}
+
+
+def get_date_status_expression(start_field, end_field, warning_days=None):
+    """
+    Build a SQL expression evaluating to the DateStatusChoices bucket of a start/end date range.
+
+    The buckets match DateStatusMixin.get_date_status(). Rows without any date evaluate to NULL.
+
+    Args:
+        start_field (str): Name of the start date field
+        end_field (str): Name of the end date field
+        warning_days (int): Days before the end date in which the range is expiring
+            (default: "expiry_warning_days" plugin setting)
+
+    Returns:
+        Case: Expression usable in annotate(), filter() and order_by()
+    """
+    if warning_days is None:
+        warning_days = get_expiry_warning_days()
+    today = timezone.now().date()
+    return Case(
+        When(**{f"{start_field}__isnull": True, f"{end_field}__isnull": True}, then=None),
+        When(**{f"{start_field}__gt": today}, then=Value(DateStatusChoices.UPCOMING)),
+        When(**{f"{end_field}__lte": today}, then=Value(DateStatusChoices.EXPIRED)),
+        When(**{f"{end_field}__lte": today + timedelta(days=warning_days)}, then=Value(DateStatusChoices.EXPIRING)),
+        When(
+            Q(**{f"{start_field}__isnull": False})
+            & Q(**{f"{end_field}__lte": F(start_field) + timedelta(days=DATE_STATUS_SHORT_DURATION_DAYS)}),
+            then=Value(DateStatusChoices.EXPIRING),
+        ),
+        default=Value(DateStatusChoices.ACTIVE),
+        output_field=CharField(),
+    )
+
+
+def annotate_date_status(queryset, start_field, end_field, name):
+    """
+    Annotate the date status bucket of each object, unless the queryset already carries it.
+
+    Args:
+        queryset (QuerySet): Queryset to annotate
+        start_field (str): Name of the start date field
+        end_field (str): Name of the end date field
+        name (str): Name of the annotation, e.g. "warranty_state"
+
+    Returns:
+        QuerySet: Annotated queryset
+    """
+    if name in queryset.query.annotations:
+        return queryset
+    return queryset.annotate(**{name: get_date_status_expression(start_field, end_field)})
+
+
+def get_date_status_order(name):
+    """
+    Build a SQL expression ranking a date status annotation from most to least urgent.
+
+    Args:
+        name (str): Name of the date status annotation
+
+    Returns:
+        Case: Integer rank, objects without dates last
+    """
+    return Case(
+        *[When(**{name: value}, then=Value(rank)) for rank, value in enumerate(DATE_STATUS_COLORS)],
+        default=Value(len(DATE_STATUS_COLORS)),
+        output_field=IntegerField(),
+    )
 
 
 class DateStatusMixin:
     """Mixin to provide date status functionality for models with start/end dates"""
 
-    def get_date_status(self, start_field, end_field, status_type=""):
+    def get_date_state(self, start_field, end_field, state_field=None):
+        """
+        Returns the DateStatusChoices bucket of the date range, or None if no date is set
+
+        Uses the value annotated by annotate_date_status() when available.
+
+        Args:
+            start_field (str): Name of the start date field
+            end_field (str): Name of the end date field
+            state_field (str): Name of the date status annotation
+        """
+        if state_field and hasattr(self, state_field):
+            return getattr(self, state_field)
+
+        today = timezone.now().date()
+        start_date = getattr(self, start_field)
+        end_date = getattr(self, end_field)
+
+        if not start_date and not end_date:
+            return None
+        if start_date and today < start_date:
+            return DateStatusChoices.UPCOMING
+        if end_date and end_date <= today:
+            return DateStatusChoices.EXPIRED
+        if end_date and (end_date - today).days <= get_expiry_warning_days():
+            return DateStatusChoices.EXPIRING
+        if start_date and end_date and (end_date - start_date).days <= DATE_STATUS_SHORT_DURATION_DAYS:
+            return DateStatusChoices.EXPIRING
+        return DateStatusChoices.ACTIVE
+
+    def get_date_status(self, start_field, end_field, status_type="", state_field=None):
         """
         Returns the status and color for progress bar based on start and end dates
 
@@ -12,9 +144,13 @@ class DateStatusMixin:
             start_field (str): Name of the start date field
             end_field (str): Name of the end date field
             status_type (str): Type of status (e.g., "Warranty", "Service")
+            state_field (str): Name of the date status annotation, if the object may carry one
         """
+        state = self.get_date_state(start_field, end_field, state_field)
+        if state is None:
+            return None
+
         today = timezone.now().date()
-        warning_days = 14
         start_date = getattr(self, start_field)
         end_date = getattr(self, end_field)
 
@@ -25,61 +161,18 @@ class DateStatusMixin:
             day_text = "day" if days == 1 else "days"
             return f"{message_type} {days} {day_text}"
 
-        def get_expiration_status(days_until):
-            if days_until <= 0:
-                return {
-                    "color": "danger",
-                    "message": f"Expired {format_days_message(days_until)}",
-                }
-            if days_until <= warning_days:
-                return {
-                    "color": "warning",
-                    "message": f"Expires {format_days_message(days_until)}",
-                }
-            return {
-                "color": "success",
-                "message": f"Valid until {end_date.strftime('%Y-%m-%d')}",
-            }
-
-        # No dates set
-        if not start_date and not end_date:
-            return None
+        if state == DateStatusChoices.UPCOMING:
+            message = f"Starts {format_days_message((start_date - today).days)}"
+        elif state == DateStatusChoices.EXPIRED:
+            message = f"Expired {format_days_message((end_date - today).days)}"
+        elif state == DateStatusChoices.EXPIRING:
+            message = f"Expires {format_days_message((end_date - today).days)}"
+        elif end_date:
+            message = f"Valid until {end_date.strftime('%Y-%m-%d')}"
+        else:
+            message = "Active"
 
-        # Only end date set
-        if not start_date and end_date:
-            days_until = (end_date - today).days
-            return get_expiration_status(days_until)
-
-        # Future start
-        if start_date and today < start_date:
-            days_until = (start_date - today).days
-            return {
-                "color": "info",
-                "message": f"Starts {format_days_message(days_until)}",
-            }
-
-        # Both dates set
-        if start_date and end_date:
-            total_duration = (end_date - start_date).days
-            days_until_expiration = (end_date - today).days
-
-            # Simple logic for very short durations (2 days or less)
-            if total_duration <= 2:
-                if days_until_expiration <= 0:
-                    return {
-                        "color": "danger",
-                        "message": f"Expired {format_days_message(days_until_expiration)}",
-                    }
-                return {
-                    "color": "warning",
-                    "message": f"Expires {format_days_message(days_until_expiration)}",
-                }
-
-            # Normal duration segment
-            return get_expiration_status(days_until_expiration)
-
-        # Active without end date
         return {
-            "color": "success",
-            "message": "Active",
+            "color": DATE_STATUS_COLORS[state],
+            "message": message,
         }
@@ -1,5 +1,11 @@
+import hashlib
+import json
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.query_utils import DeferredAttribute
 from django.urls import reverse
 from django.utils import timezone
 from netbox.models.features import (
@@ -13,7 +19,95 @@ from netbox.models.features import (
 )
 from utilities.querysets import RestrictedQuerySet
 
-from inventory_monitor.settings import get_probe_recent_days
+from inventory_monitor.settings import get_probe_payload_dedup, get_probe_recent_days
+
+
+def get_payload_hash(data):
+    """Return the SHA-256 hex digest of the canonical JSON form of discovered data."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ProbePayload(models.Model):
+    """
+    Discovered data shared by all probes that report the same data.
+
+    Collectors report the same data for a serial run after run. When "probe_payload_dedup"
+    is enabled, the data is stored once here, keyed by its hash, and probes reference it.
+    """
+
+    hash = models.CharField(max_length=64, unique=True, editable=False)
+    discovered_data = models.JSONField(default=dict)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["discovered_data"], name="invmon_payload_data_gin_idx", opclasses=["jsonb_path_ops"]),
+        ]
+        verbose_name = "Probe payload"
+        verbose_name_plural = "Probe payloads"
+
+    def __str__(self):
+        return self.hash
+
+
+class PayloadDataAttribute(DeferredAttribute):
+    """Read the discovered data of a probe from its payload when it is not stored inline."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if value is None:
+            return instance.payload.discovered_data if instance.payload_id else {}
+        return value
+
+
+class PayloadJSONField(models.JSONField):
+    """JSONField whose NULL value stands for the data of the probe payload."""
+
+    descriptor_class = PayloadDataAttribute
+
+
+def store_probe_payloads(probes):
+    """
+    Move the discovered data of probes to shared payloads, before the probes are saved.
+
+    Existing payloads are looked up by hash with one query and missing ones are inserted
+    with one bulk INSERT. Probes without data keep their (empty) data inline.
+
+    Args:
+        probes (list): Unsaved Probe instances
+    """
+    data_by_hash = {}
+    probes_by_hash = {}
+    for probe in probes:
+        data = probe.__dict__.get("discovered_data")
+        if not data:
+            continue
+        payload_hash = get_payload_hash(data)
+        data_by_hash[payload_hash] = data
+        probes_by_hash.setdefault(payload_hash, []).append(probe)
+
+    if not data_by_hash:
+        return
+
+    payload_ids = dict(ProbePayload.objects.filter(hash__in=data_by_hash).values_list("hash", "pk"))
+    missing = [ProbePayload(hash=h, discovered_data=data) for h, data in data_by_hash.items() if h not in payload_ids]
+    if missing:
+        # Conflicts are payloads inserted concurrently, read them back with the new ones
+        ProbePayload.objects.bulk_create(missing, ignore_conflicts=True)
+        payload_ids.update(
+            ProbePayload.objects.filter(hash__in=[payload.hash for payload in missing]).values_list("hash", "pk")
+        )
+
+    for payload_hash, hash_probes in probes_by_hash.items():
+        # Built from the data at hand, the stored payload has the same data
+        payload = ProbePayload(
+            pk=payload_ids[payload_hash], hash=payload_hash, discovered_data=data_by_hash[payload_hash]
+        )
+        for probe in hash_probes:
+            probe.payload = payload
+            probe.discovered_data = None
 
 
 class Probe(
@@ -55,14 +149,29 @@ class Probe(
     )
     description = models.TextField(blank=True)
     comments = models.TextField(blank=True)
-    discovered_data = models.JSONField(default=dict, blank=True)
+    # NULL when the data is stored in the payload (see store_probe_payloads())
+    discovered_data = PayloadJSONField(default=dict, blank=True, null=True)
+    payload = models.ForeignKey(
+        to="inventory_monitor.ProbePayload",
+        on_delete=models.PROTECT,
+        related_name="probes",
+        blank=True,
+        null=True,
+        editable=False,
+    )
     category = models.CharField(blank=True, null=True, max_length=255)
 
+    # Full-text search vector, maintained only when "search_vector_enabled" is set
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
     class Meta:
         indexes = [
             models.Index(fields=["serial"], name="invmon_probe_serial_idx"),
             models.Index(fields=["time"], name="invmon_probe_time_idx"),
             models.Index(fields=["serial", "time"], name="invmon_probe_serial_time_idx"),
+            GinIndex(fields=["search_vector"], name="invmon_probe_fts_idx"),
+            # jsonb_path_ops serves containment (@>) only, see ProbeFilterSet discovered_data filters
+            GinIndex(fields=["discovered_data"], name="invmon_probe_data_gin_idx", opclasses=["jsonb_path_ops"]),
         ]
         ordering = (
             "name",
@@ -86,6 +195,19 @@ class Probe(
     def get_absolute_url(self):
         return reverse("plugins:inventory_monitor:probe", args=[self.pk])
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if self.__dict__.get("discovered_data") is not None and (
+            update_fields is None or "discovered_data" in update_fields
+        ):
+            # New data replaces the payload, stored again as a payload when enabled
+            self.payload = None
+            if get_probe_payload_dedup():
+                store_probe_payloads([self])
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "payload"}
+        super().save(*args, **kwargs)
+
     def clean(self):
         """
         Custom validation for Probe model.
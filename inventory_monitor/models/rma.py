@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.urls import reverse
 from netbox.models import NetBoxModel
 from utilities.choices import ChoiceSet
@@ -72,6 +74,12 @@ class RMA(NetBoxModel):
 
     class Meta:
         ordering = ["date_issued"]
+        indexes = [
+            models.Index(fields=["original_serial"], name="invmon_rma_orig_serial_idx"),
+            models.Index(fields=["replacement_serial"], name="invmon_rma_repl_serial_idx"),
+            GinIndex(OpClass(Upper("original_serial"), name="gin_trgm_ops"), name="invmon_rma_orig_serial_trgm"),
+            GinIndex(OpClass(Upper("replacement_serial"), name="gin_trgm_ops"), name="invmon_rma_repl_serial_trgm"),
+        ]
         verbose_name = "RMA"
         verbose_name_plural = "RMAs"
 
@@ -92,16 +100,20 @@ class RMA(NetBoxModel):
         if not self.original_serial and self.asset:
             self.original_serial = self.asset.serial
 
-        # Check if this is an existing RMA with status change
+        # The status at load time is remembered by a post_init handler (see signals), so a
+        # status change is detected without reading the stored RMA again
+        previous_status = None
         if self.pk:
-            previous = RMA.objects.get(pk=self.pk)
-            if previous.status != self.status and self.status == RMAStatusChoices.COMPLETED:
-                self.update_asset_serial()
-        # Check if this is a new RMA with COMPLETED status
-        elif self.status == RMAStatusChoices.COMPLETED:
+            previous_status = getattr(self, "_loaded_status", None)
+            if previous_status is None:
+                # Status was deferred when the RMA was loaded
+                previous_status = RMA.objects.filter(pk=self.pk).values_list("status", flat=True).first()
+
+        if self.status == RMAStatusChoices.COMPLETED and previous_status != RMAStatusChoices.COMPLETED:
             self.update_asset_serial()
 
         super().save(*args, **kwargs)
+        self._loaded_status = self.status
 
     def update_asset_serial(self):
         """
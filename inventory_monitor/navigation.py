@@ -32,6 +32,16 @@ menu = PluginMenu(
                     link_text="Services",
                     permissions=["inventory_monitor.view_assetservice"],
                 ),
+                PluginMenuItem(
+                    link="plugins:inventory_monitor:expiry_forecast",
+                    link_text="Expiry Forecast",
+                    permissions=["inventory_monitor.view_asset", "inventory_monitor.view_assetservice"],
+                ),
+                PluginMenuItem(
+                    link="plugins:inventory_monitor:rma_failure_rates",
+                    link_text="RMA Failure Rates",
+                    permissions=["inventory_monitor.view_asset", "inventory_monitor.view_rma"],
+                ),
             ),
         ),
         (
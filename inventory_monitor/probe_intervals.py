@@ -0,0 +1,278 @@
+"""
+Probe history stored as observation intervals.
+
+Collectors report every item they find on every run. Instead of a probe per run, a probe is
+an interval of observations of one item, identified by (serial, device, name, part):
+``creation_time`` is when the item was first seen and ``time`` when it was last seen. A new
+interval starts when anything else reported about the item changes, or when the item was not
+seen for more than ``probe_interval_max_gap_hours``.
+
+ProbeDiffView keeps its meaning: items added in a period are the intervals starting in it,
+items removed are the intervals last seen in it.
+
+The probe import and probe creation through the REST API extend the current interval of an
+item instead of inserting a probe (see extend_probe_intervals()). Probes stored one per run,
+e.g. before intervals were used or saved from the UI, are collapsed by
+compact_probe_intervals().
+"""
+
+import zlib
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import TextField
+from django.db.models.functions import MD5, Cast, Coalesce
+from extras.models import JournalEntry, TaggedItem
+
+from inventory_monitor.helpers import get_content_type
+from inventory_monitor.models import Probe
+from inventory_monitor.settings import get_probe_interval_max_gap_hours
+
+PROBE_INTERVAL_KEY = ("serial", "device_id", "name", "part")
+
+# Everything else reported about an item, a change starts a new interval
+PROBE_CONTENT_FIELDS = (
+    "site_id",
+    "location_id",
+    "device_descriptor",
+    "site_descriptor",
+    "location_descriptor",
+    "description",
+    "category",
+    "comments",
+    "custom_field_data",
+)
+
+# Serials compacted per batch, all probes of a serial are compacted together
+COMPACTION_BATCH_SIZE = 200
+
+# First key of the advisory locks on probe serials, keeps them apart from other locks
+PROBE_LOCK_NAMESPACE = 0x494D
+
+
+def get_probe_interval_max_gap():
+    """Return the longest gap between observations within one interval, None if intervals are disabled."""
+    hours = get_probe_interval_max_gap_hours()
+    return timedelta(hours=hours) if hours else None
+
+
+def get_interval_start(creation_time, time):
+    """Return when an observation (interval) started, creation_time may be missing or after time."""
+    return min(creation_time, time) if creation_time else time
+
+
+def lock_probe_serials(serials):
+    """
+    Lock the probes of serials until the end of the current transaction.
+
+    The probe import and compaction both read the intervals of a serial and write them back
+    later, the lock keeps one from changing or deleting intervals the other has read. A
+    transaction level advisory lock is taken per serial (two serials may share one), in key
+    order so that concurrent callers do not deadlock.
+    """
+    keys = sorted({zlib.crc32(serial.encode()) - 2**31 for serial in serials})
+    if not keys:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, key) FROM unnest(%s::integer[]) AS key",
+            [PROBE_LOCK_NAMESPACE, keys],
+        )
+
+
+def get_tag_ids(pks):
+    """Return the tag IDs of probes by probe ID, with one query."""
+    tag_ids = {}
+    tagged_items = TaggedItem.objects.filter(content_type=get_content_type(Probe), object_id__in=pks)
+    for object_id, tag_id in tagged_items.values_list("object_id", "tag_id"):
+        tag_ids.setdefault(object_id, set()).add(tag_id)
+    return tag_ids
+
+
+def get_current_intervals(keys):
+    """
+    Get the most recent interval of items, with one query.
+
+    Args:
+        keys (set): Item keys, tuples of the PROBE_INTERVAL_KEY values
+
+    Returns:
+        dict: Interval by item key, with its "pk", "start", "time" and "content"
+    """
+    rows = (
+        Probe.objects.filter(serial__in={key[0] for key in keys})
+        .order_by(*PROBE_INTERVAL_KEY, "-time")
+        .distinct(*PROBE_INTERVAL_KEY)
+        .annotate(data=Coalesce("discovered_data", "payload__discovered_data"))
+        .values("pk", "creation_time", "time", "data", *PROBE_INTERVAL_KEY, *PROBE_CONTENT_FIELDS)
+    )
+    rows = [row for row in rows if tuple(row[field] for field in PROBE_INTERVAL_KEY) in keys]
+    tag_ids = get_tag_ids([row["pk"] for row in rows])
+
+    return {
+        tuple(row[field] for field in PROBE_INTERVAL_KEY): {
+            "pk": row["pk"],
+            "probe": None,
+            "start": get_interval_start(row["creation_time"], row["time"]),
+            "time": row["time"],
+            "content": (
+                *(row[field] for field in PROBE_CONTENT_FIELDS),
+                row["data"] or {},
+                frozenset(tag_ids.get(row["pk"], ())),
+            ),
+        }
+        for row in rows
+    }
+
+
+def extend_probe_intervals(batch, max_gap, changeable=None):
+    """
+    Extend the current intervals of imported items instead of inserting new probes.
+
+    An imported probe extends the most recent interval of its item (stored, or imported
+    earlier in the batch) when it reports the same content and starts at most ``max_gap``
+    after the interval was last seen. The extended intervals are updated with one
+    ``bulk_update``.
+
+    Must run in a transaction, the serials of the batch stay locked until it ends (see
+    lock_probe_serials()).
+
+    Args:
+        batch (list): (unsaved Probe, tags) tuples
+        max_gap (timedelta): Longest gap between observations within one interval
+        changeable (QuerySet): Probes that may be extended, e.g. restricted to the user's
+            change permission. Items whose current interval is outside it get a new probe.
+
+    Returns:
+        tuple: (batch items to insert, IDs of the extended probes)
+    """
+    keys = {tuple(getattr(probe, field) for field in PROBE_INTERVAL_KEY) for probe, _ in batch}
+    lock_probe_serials({key[0] for key in keys})
+    current = get_current_intervals(keys)
+    if changeable is not None:
+        permitted = set(
+            changeable.filter(pk__in=[interval["pk"] for interval in current.values()]).values_list("pk", flat=True)
+        )
+        current = {key: interval for key, interval in current.items() if interval["pk"] in permitted}
+
+    inserted = set()
+    extended = {}
+    for index, (probe, tags) in sorted(
+        enumerate(batch), key=lambda item: get_interval_start(item[1][0].creation_time, item[1][0].time)
+    ):
+        key = tuple(getattr(probe, field) for field in PROBE_INTERVAL_KEY)
+        start = get_interval_start(probe.creation_time, probe.time)
+        content = (
+            *(getattr(probe, field) for field in PROBE_CONTENT_FIELDS),
+            probe.__dict__.get("discovered_data") or {},
+            frozenset(tag.pk for tag in tags),
+        )
+
+        interval = current.get(key)
+        if (
+            interval is not None
+            and interval["content"] == content
+            and interval["start"] <= start
+            and start - interval["time"] <= max_gap
+        ):
+            interval["time"] = max(interval["time"], probe.time)
+            if interval["probe"] is not None:
+                interval["probe"].time = interval["time"]
+            else:
+                extended[interval["pk"]] = interval["time"]
+            continue
+
+        inserted.add(index)
+        current[key] = {"pk": None, "probe": probe, "start": start, "time": probe.time, "content": content}
+
+    Probe.objects.bulk_update([Probe(pk=pk, time=time) for pk, time in extended.items()], ["time"])
+    return [item for index, item in enumerate(batch) if index in inserted], list(extended)
+
+
+def compact_probe_intervals(serials, max_gap):
+    """
+    Collapse the probes of the given serials into intervals.
+
+    Probes of an item are walked in order of their start. A probe reporting the same content
+    as the current interval, and starting at most ``max_gap`` after it was last seen, is
+    merged into it: the interval is extended to the probe's last observation and the probe is
+    deleted. Discovered data is compared by a digest computed in the database. Probes with
+    journal entries are kept, they always start a new interval.
+
+    The probes are read and written in one transaction, with their serials locked against a
+    concurrent probe import.
+
+    Args:
+        serials (list): Serials to compact
+        max_gap (timedelta): Longest gap between observations within one interval
+
+    Returns:
+        tuple: (number of intervals extended, number of probes merged and deleted)
+    """
+    with transaction.atomic():
+        lock_probe_serials(serials)
+
+        rows = list(
+            Probe.objects.filter(serial__in=serials)
+            .annotate(
+                data_digest=MD5(Cast(Coalesce("discovered_data", "payload__discovered_data"), output_field=TextField()))
+            )
+            # Sorted per item below, skip the model ordering (it includes discovered_data)
+            .order_by()
+            .values("pk", "creation_time", "time", "data_digest", *PROBE_INTERVAL_KEY, *PROBE_CONTENT_FIELDS)
+        )
+        pks = [row["pk"] for row in rows]
+        tag_ids = get_tag_ids(pks)
+        journaled = set(
+            JournalEntry.objects.filter(
+                assigned_object_type=get_content_type(Probe), assigned_object_id__in=pks
+            ).values_list("assigned_object_id", flat=True)
+        )
+
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(row[field] for field in PROBE_INTERVAL_KEY), []).append(row)
+
+        extended = {}
+        merged = []
+        for group in groups.values():
+            group.sort(key=lambda row: (get_interval_start(row["creation_time"], row["time"]), row["time"], row["pk"]))
+            interval = None
+            for row in group:
+                content = (
+                    *(row[field] for field in PROBE_CONTENT_FIELDS),
+                    row["data_digest"],
+                    frozenset(tag_ids.get(row["pk"], ())),
+                )
+                start = get_interval_start(row["creation_time"], row["time"])
+                if (
+                    interval is not None
+                    and row["pk"] not in journaled
+                    and interval["content"] == content
+                    and start - interval["time"] <= max_gap
+                ):
+                    if row["time"] > interval["time"]:
+                        interval["time"] = row["time"]
+                        extended[interval["pk"]] = row["time"]
+                    merged.append(row["pk"])
+                    continue
+                interval = {"pk": row["pk"], "time": row["time"], "content": content}
+
+        Probe.objects.bulk_update([Probe(pk=pk, time=time) for pk, time in extended.items()], ["time"])
+        # Tags and cached search values of the merged probes are deleted with them
+        Probe.objects.filter(pk__in=merged).delete()
+
+    return len(extended), len(merged)
+
+
+def iter_compaction_batches(queryset, batch_size=COMPACTION_BATCH_SIZE):
+    """Yield batches of the distinct serials of a probe queryset."""
+    serials = queryset.order_by("serial").values_list("serial", flat=True).distinct()
+    last_serial = None
+    while True:
+        batch = serials.filter(serial__gt=last_serial) if last_serial is not None else serials
+        batch = list(batch[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_serial = batch[-1]
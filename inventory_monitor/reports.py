@@ -0,0 +1,446 @@
+"""
+Reports for Inventory Monitor Plugin.
+
+Report aggregates are computed with GROUP BY in the database and cached for
+the ``report_cache_timeout`` plugin setting.
+"""
+
+import calendar
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import (
+    Avg,
+    CharField,
+    Count,
+    DateField,
+    DecimalField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, Least, TruncDate, TruncMonth
+from django.utils import timezone
+
+from inventory_monitor.models import Asset, AssetService, Contract, Invoice, Probe
+from inventory_monitor.settings import get_contract_rollup_cache_timeout, get_report_cache_timeout
+
+# Report grouping: (Asset field, AssetService field)
+EXPIRY_FORECAST_GROUP_BY = {
+    "vendor": ("vendor", "asset__vendor"),
+    "project": ("project", "asset__project"),
+    "type": ("type__name", "asset__type__name"),
+}
+
+EXPIRY_FORECAST_MAX_MONTHS = 36
+
+EXPIRY_FORECAST_COLUMNS = ("month", "kind", "group", "count", "quantity", "value")
+
+
+def get_asset_value_expression(prefix=""):
+    """Build the expression of the total value of an asset record (price * quantity)."""
+    return ExpressionWrapper(
+        F(f"{prefix}price") * F(f"{prefix}quantity"),
+        output_field=DecimalField(max_digits=19, decimal_places=2),
+    )
+
+
+def add_months(day, months):
+    """Return the first day of the month ``months`` months after the month of ``day``."""
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_expiry_forecast(assets, services, group_by="vendor", months=12):
+    """
+    Aggregate expiring warranties and services into monthly buckets.
+
+    Warranties are counted from ``Asset.warranty_end`` with the asset quantity and value,
+    services from ``AssetService.service_end`` with the service price. Each of them is one
+    GROUP BY query over the upcoming ``months`` months, starting today.
+
+    Args:
+        assets (QuerySet): Asset queryset, already restricted for the user
+        services (QuerySet): AssetService queryset, already restricted for the user
+        group_by (str): Key of EXPIRY_FORECAST_GROUP_BY
+        months (int): Number of months to forecast
+
+    Returns:
+        list: Rows with the keys of EXPIRY_FORECAST_COLUMNS, ordered by month
+    """
+    asset_field, service_field = EXPIRY_FORECAST_GROUP_BY[group_by]
+    today = timezone.now().date()
+    end = add_months(today, months)
+    zero = Value(Decimal("0"), output_field=DecimalField())
+
+    warranty_rows = (
+        assets.filter(warranty_end__gte=today, warranty_end__lt=end)
+        .annotate(month=TruncMonth("warranty_end"), group=F(asset_field))
+        .values("month", "group")
+        .annotate(
+            count=Count("pk"),
+            quantity=Sum("quantity"),
+            value=Coalesce(Sum(get_asset_value_expression()), zero),
+        )
+        .order_by()
+    )
+    service_rows = (
+        services.filter(service_end__gte=today, service_end__lt=end)
+        .annotate(month=TruncMonth("service_end"), group=F(service_field))
+        .values("month", "group")
+        .annotate(
+            count=Count("pk"),
+            value=Coalesce(Sum("service_price"), zero),
+        )
+        .order_by()
+    )
+
+    rows = [{**row, "kind": "warranty"} for row in warranty_rows]
+    rows.extend({**row, "kind": "service", "quantity": None} for row in service_rows)
+    rows.sort(key=lambda row: (row["month"], row["kind"], row["group"] or ""))
+    return rows
+
+
+def get_cached_expiry_forecast(user, assets, services, group_by="vendor", months=12):
+    """
+    Get the expiry forecast from the cache, computing it on a miss.
+
+    Results are cached per user, because the querysets are restricted by the user's permissions.
+
+    Args:
+        user: User the querysets are restricted for
+        assets (QuerySet): Asset queryset
+        services (QuerySet): AssetService queryset
+        group_by (str): Key of EXPIRY_FORECAST_GROUP_BY
+        months (int): Number of months to forecast
+
+    Returns:
+        list: Rows as returned by get_expiry_forecast()
+    """
+    cache_key = f"inventory_monitor:expiry_forecast:{user.pk}:{group_by}:{months}:{timezone.now().date().isoformat()}"
+    return cache.get_or_set(
+        cache_key,
+        lambda: get_expiry_forecast(assets, services, group_by=group_by, months=months),
+        get_report_cache_timeout(),
+    )
+
+
+RMA_FAILURE_RATE_COLUMNS = (
+    "vendor",
+    "partnumber",
+    "type",
+    "installed",
+    "rma_count",
+    "failed_assets",
+    "rma_rate",
+    "mean_days_to_rma",
+)
+
+
+def get_first_probe_date_subquery():
+    """
+    Build a correlated subquery of the date an RMA's original serial (or asset serial) was first probed.
+
+    A probe stores an interval of observations, it starts at the earlier of creation_time and time.
+    """
+    return Subquery(
+        Probe.objects.filter(
+            serial=Coalesce(OuterRef("original_serial"), OuterRef("asset__serial"), output_field=CharField())
+        )
+        .order_by()
+        .annotate(first_group=Value(1))
+        .values("first_group")
+        .annotate(first_time=Min(Least("creation_time", "time")))
+        .values("first_time")
+    )
+
+
+def get_rma_failure_rates(assets, rmas, since=None):
+    """
+    Aggregate RMAs per vendor, part number and asset type against the installed base.
+
+    The installed base (sum of asset quantities) and the RMAs are counted with one GROUP BY
+    query each. The time to RMA is the number of days from the asset warranty start, or from
+    the first probe of the returned serial when the warranty start is not set, to the RMA
+    issue date; RMAs with neither date are left out of the mean.
+
+    Args:
+        assets (QuerySet): Asset queryset, already restricted for the user
+        rmas (QuerySet): RMA queryset, already restricted for the user
+        since (date): Count only RMAs issued on or after this date
+
+    Returns:
+        list: Rows with the keys of RMA_FAILURE_RATE_COLUMNS, highest RMA rate first
+    """
+    if since:
+        rmas = rmas.filter(date_issued__gte=since)
+
+    installed_rows = (
+        assets.values("vendor", "partnumber", "type__name").annotate(installed=Sum("quantity")).order_by()
+    )
+
+    service_start = Coalesce(
+        "asset__warranty_start", TruncDate(get_first_probe_date_subquery()), output_field=DateField()
+    )
+    rma_rows = (
+        rmas.values("asset__vendor", "asset__partnumber", "asset__type__name")
+        .annotate(
+            rma_count=Count("pk"),
+            failed_assets=Count("asset", distinct=True),
+            mean_time_to_rma=Avg(
+                ExpressionWrapper(F("date_issued") - service_start, output_field=DurationField())
+            ),
+        )
+        .order_by()
+    )
+
+    installed = {(row["vendor"], row["partnumber"], row["type__name"]): row["installed"] for row in installed_rows}
+    rows = []
+    for row in rma_rows:
+        key = (row["asset__vendor"], row["asset__partnumber"], row["asset__type__name"])
+        installed_count = installed.get(key) or 0
+        mean_time = row["mean_time_to_rma"]
+        rows.append(
+            {
+                "vendor": key[0],
+                "partnumber": key[1],
+                "type": key[2],
+                "installed": installed_count,
+                "rma_count": row["rma_count"],
+                "failed_assets": row["failed_assets"],
+                "rma_rate": round(row["rma_count"] / installed_count, 4) if installed_count else None,
+                "mean_days_to_rma": round(mean_time.total_seconds() / 86400, 1) if mean_time is not None else None,
+            }
+        )
+
+    rows.sort(key=lambda row: (-(row["rma_rate"] or 0), -row["rma_count"], str(row["vendor"]), str(row["partnumber"])))
+    return rows
+
+
+def get_cached_rma_failure_rates(user, assets, rmas, since=None):
+    """
+    Get the RMA failure rates from the cache, computing them on a miss.
+
+    Results are cached per user, because the querysets are restricted by the user's permissions.
+
+    Args:
+        user: User the querysets are restricted for
+        assets (QuerySet): Asset queryset
+        rmas (QuerySet): RMA queryset
+        since (date): Count only RMAs issued on or after this date
+
+    Returns:
+        list: Rows as returned by get_rma_failure_rates()
+    """
+    since_key = since.isoformat() if since else "all"
+    cache_key = f"inventory_monitor:rma_failure_rates:{user.pk}:{since_key}:{timezone.now().date().isoformat()}"
+    return cache.get_or_set(
+        cache_key,
+        lambda: get_rma_failure_rates(assets, rmas, since=since),
+        get_report_cache_timeout(),
+    )
+
+
+def get_contract_tree_subquery(queryset, contract_field, aggregate):
+    """
+    Build a correlated subquery aggregating objects of a contract and of its subcontracts.
+
+    Args:
+        queryset (QuerySet): Objects to aggregate
+        contract_field (str): Name of the objects' contract foreign key
+        aggregate: Aggregate expression
+
+    Returns:
+        Subquery: Scalar aggregate, NULL when there is nothing to aggregate
+    """
+    contract_tree = Q(**{contract_field: OuterRef("pk")}) | Q(**{f"{contract_field}__parent": OuterRef("pk")})
+    return Subquery(
+        queryset.filter(contract_tree)
+        .order_by()
+        # Constant grouping makes a single aggregate row over the filtered objects
+        .annotate(rollup_group=Value(1))
+        .values("rollup_group")
+        .annotate(total=aggregate)
+        .values("total")
+    )
+
+
+def annotate_contract_rollups(queryset, user):
+    """
+    Annotate totals of each contract together with its subcontracts.
+
+    Contracts nest one level deep (subcontracts cannot have subcontracts), so the rollup
+    of a contract covers the objects of the contract and of its direct subcontracts. Only
+    the invoices, assets and services the user may view are counted.
+
+    Args:
+        queryset (QuerySet): Contract queryset
+        user: User the totals are restricted for
+
+    Returns:
+        QuerySet: Queryset annotated with rollup_invoiced, rollup_assets_count,
+            rollup_assets_value and rollup_services_cost
+    """
+    zero = Value(Decimal("0"), output_field=DecimalField())
+    invoices = Invoice.objects.restrict(user, "view")
+    assets = Asset.objects.restrict(user, "view")
+    services = AssetService.objects.restrict(user, "view")
+    return queryset.annotate(
+        rollup_invoiced=Coalesce(get_contract_tree_subquery(invoices, "contract", Sum("price")), zero),
+        rollup_assets_count=Coalesce(get_contract_tree_subquery(assets, "order_contract", Count("pk")), Value(0)),
+        rollup_assets_value=Coalesce(
+            get_contract_tree_subquery(assets, "order_contract", Sum(get_asset_value_expression())), zero
+        ),
+        rollup_services_cost=Coalesce(get_contract_tree_subquery(services, "contract", Sum("service_price")), zero),
+    )
+
+
+CONTRACT_ROLLUP_FIELDS = ("rollup_invoiced", "rollup_assets_count", "rollup_assets_value", "rollup_services_cost")
+
+
+def get_contract_rollups(contract, user):
+    """
+    Get the rollup totals of a contract, cached per user when "contract_rollup_cache_timeout" is set.
+
+    Args:
+        contract (Contract): Contract
+        user: User the totals are restricted for
+
+    Returns:
+        dict: Totals keyed by CONTRACT_ROLLUP_FIELDS
+    """
+
+    def compute():
+        contracts = annotate_contract_rollups(Contract.objects.filter(pk=contract.pk), user)
+        return contracts.values(*CONTRACT_ROLLUP_FIELDS).get()
+
+    timeout = get_contract_rollup_cache_timeout()
+    if not timeout:
+        return compute()
+    return cache.get_or_set(f"inventory_monitor:contract_rollups:{contract.pk}:{user.pk}", compute, timeout)
+
+
+def get_contract_burndown(contract, invoices):
+    """
+    Compare invoiced spending of a contract and its subcontracts with the contract budget.
+
+    Invoices are summed per month of their invoicing start (or end, when the start is not
+    set) with one GROUP BY query. Every month carries the cumulative invoiced amount, the
+    remaining budget and, when the contract has an invoicing period, the remaining budget
+    of a linear spending plan over that period.
+
+    Args:
+        contract (Contract): Contract
+        invoices (QuerySet): Invoice queryset
+
+    Returns:
+        dict: "budget", "invoiced", "undated" (sum of invoices without dates) and "months"
+    """
+    budget = contract.price
+    monthly = (
+        invoices.filter(Q(contract=contract) | Q(contract__parent=contract))
+        .annotate(month=TruncMonth(Coalesce("invoicing_start", "invoicing_end")))
+        .values("month")
+        .annotate(invoiced=Sum("price"))
+        .order_by("month")
+    )
+
+    undated = Decimal("0")
+    cumulative = Decimal("0")
+    months = []
+    for row in monthly:
+        if row["month"] is None:
+            undated = row["invoiced"]
+            continue
+        cumulative += row["invoiced"]
+        months.append(
+            {
+                "month": row["month"],
+                "invoiced": row["invoiced"],
+                "cumulative": cumulative,
+                "remaining": budget - cumulative if budget is not None else None,
+                "planned_remaining": get_planned_remaining(contract, row["month"]),
+            }
+        )
+
+    return {
+        "budget": budget,
+        "invoiced": cumulative + undated,
+        "undated": undated,
+        "months": months,
+    }
+
+
+def get_planned_remaining(contract, month):
+    """Remaining budget at the end of ``month`` if it was spent linearly over the invoicing period."""
+    if contract.price is None or not contract.invoicing_start or not contract.invoicing_end:
+        return None
+
+    month_end = month.replace(day=calendar.monthrange(month.year, month.month)[1])
+    period_days = (contract.invoicing_end - contract.invoicing_start).days + 1
+    elapsed_days = min(max((month_end - contract.invoicing_start).days + 1, 0), period_days)
+    return (contract.price * (period_days - elapsed_days) / period_days).quantize(Decimal("0.01"))
+
+
+def get_contract_burndown_version_key(contract_id):
+    return f"inventory_monitor:contract_burndown_version:{contract_id}"
+
+
+def get_contract_burndown_cache_key(contract_id, user):
+    """
+    Build the cache key of a user's burn-down of a contract.
+
+    The key includes a version of the contract's burn-downs, so invalidate_contract_burndowns()
+    drops the cached burn-downs of all users by deleting the version.
+    """
+    version_key = get_contract_burndown_version_key(contract_id)
+    if (version := cache.get(version_key)) is None:
+        cache.add(version_key, uuid.uuid4().hex, None)
+        version = cache.get(version_key)
+    return f"inventory_monitor:contract_burndown:{contract_id}:{version}:{user.pk}"
+
+
+def get_cached_contract_burndown(user, contract, invoices):
+    """
+    Get the burn-down of a contract from the cache, computing it on a miss.
+
+    Cached per user for "report_cache_timeout" seconds, because the invoices are restricted
+    by the user's permissions. Invalidated by invalidate_contract_burndowns() when invoices
+    of the contract or of its subcontracts, or the contract itself, change.
+
+    Args:
+        user: User the invoices are restricted for
+        contract (Contract): Contract
+        invoices (QuerySet): Invoice queryset
+
+    Returns:
+        dict: Burn-down as returned by get_contract_burndown()
+    """
+    return cache.get_or_set(
+        get_contract_burndown_cache_key(contract.pk, user),
+        lambda: get_contract_burndown(contract, invoices),
+        get_report_cache_timeout(),
+    )
+
+
+def invalidate_contract_burndowns(contract_ids):
+    """
+    Drop cached burn-downs of the given contracts and of their parent contracts.
+
+    Args:
+        contract_ids (set): Contract IDs
+    """
+    contract_ids = {pk for pk in contract_ids if pk is not None}
+    if not contract_ids:
+        return
+
+    parent_ids = Contract.objects.filter(pk__in=contract_ids, parent__isnull=False).values_list("parent_id", flat=True)
+    cache.delete_many([get_contract_burndown_version_key(pk) for pk in contract_ids.union(parent_ids)])
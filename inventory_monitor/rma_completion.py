@@ -0,0 +1,114 @@
+"""
+Bulk completion of RMAs for Inventory Monitor Plugin.
+
+Completing an RMA with RMA.save() reads and saves its asset, one RMA at a time. The
+operation below completes any number of RMAs with a fixed number of statements: the RMAs
+and their assets are loaded with one query, then the statuses and asset serials are written
+with one ``bulk_update`` each, the change log with one bulk INSERT and the search data in
+batches.
+
+The serial lineage is kept as RMA.save() keeps it: an RMA without original serial gets the
+asset serial before the replacement, and the asset takes the replacement serial. Several
+RMAs of the same asset are applied in the order they were issued, each one starting from the
+serial the previous one left, so every serial of the asset stays on one of its RMAs and
+probes of earlier serials still match the asset.
+
+``bulk_update`` does not send ``post_save``, so NetBox does not queue the "object updated"
+events of the RMAs and assets. enqueue_update_events() queues them, event rules (and
+webhooks) then run for them when the request completes, as for objects edited one by one.
+"""
+
+import uuid
+
+from core.choices import ObjectChangeActionChoices
+from core.events import OBJECT_UPDATED
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from extras.events import enqueue_event
+from netbox.context import events_queue
+
+from inventory_monitor.helpers import create_object_changes
+from inventory_monitor.models import RMA, Asset
+from inventory_monitor.models.rma import RMAStatusChoices
+from inventory_monitor.search import cache_search_values
+from inventory_monitor.search_vectors import update_search_vectors
+from inventory_monitor.settings import get_search_vector_enabled
+
+
+def complete_rmas(rmas, user, request_id=None):
+    """
+    Set RMAs to completed and apply their replacement serials to the assets.
+
+    RMAs already completed are left alone.
+
+    Args:
+        rmas (QuerySet): RMAs to complete
+        user (User): User completing the RMAs, recorded in the change log
+        request_id (UUID): ID grouping the change log entries
+
+    Returns:
+        tuple: (completed RMAs, assets whose serial changed)
+    """
+    request_id = request_id or uuid.uuid4()
+    now = timezone.now()
+
+    rmas = list(
+        rmas.exclude(status=RMAStatusChoices.COMPLETED)
+        .select_related("asset")
+        .prefetch_related("tags", "asset__tags")
+        .order_by(F("date_issued").asc(nulls_last=True), "pk")
+    )
+
+    # One instance per asset, so RMAs of the same asset are applied one after another
+    assets = {}
+    changed_assets = {}
+    for rma in rmas:
+        rma.snapshot()
+        if rma.asset_id not in assets:
+            assets[rma.asset_id] = rma.asset
+            rma.asset.snapshot()
+        asset = assets[rma.asset_id]
+
+        if not rma.original_serial:
+            rma.original_serial = asset.serial
+        rma.status = RMAStatusChoices.COMPLETED
+        rma.last_updated = now
+        rma._loaded_status = rma.status
+
+        if rma.replacement_serial and rma.replacement_serial != asset.serial:
+            asset.serial = rma.replacement_serial
+            asset.last_updated = now
+            changed_assets[asset.pk] = asset
+
+    with transaction.atomic():
+        RMA.objects.bulk_update(rmas, ["status", "original_serial", "last_updated"])
+        Asset.objects.bulk_update(changed_assets.values(), ["serial", "last_updated"])
+
+        create_object_changes(rmas, ObjectChangeActionChoices.ACTION_UPDATE, user, request_id)
+        create_object_changes(changed_assets.values(), ObjectChangeActionChoices.ACTION_UPDATE, user, request_id)
+
+        cache_search_values(RMA, [rma.pk for rma in rmas])
+        if changed_assets:
+            cache_search_values(Asset, list(changed_assets))
+            if get_search_vector_enabled():
+                update_search_vectors(Asset.objects.filter(pk__in=changed_assets))
+
+    return rmas, list(changed_assets.values())
+
+
+def enqueue_update_events(request, objects):
+    """
+    Queue the "object updated" events of objects updated in bulk.
+
+    The events are processed by event rules when the request completes, the change snapshots
+    taken before the update are included.
+
+    Args:
+        request (HttpRequest): Current request
+        objects (list): Updated objects
+    """
+    queue = events_queue.get()
+    for obj in objects:
+        enqueue_event(queue, obj, request, OBJECT_UPDATED)
+    events_queue.set(queue)
@@ -1,3 +1,8 @@
+from core.models import ObjectType
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import transaction
+from extras.models import CachedValue, CustomField
+from netbox.registry import registry
 from netbox.search import SearchIndex, register_search
 
 from inventory_monitor.models import (
@@ -13,6 +18,79 @@ from inventory_monitor.models import (
 )
 
 
+def prefetch_external_inventory_numbers(assets):
+    """
+    Precompute the External Inventory numbers indexed by AssetIndex for a batch of assets.
+
+    Runs one grouped query for the whole batch instead of one query per asset.
+
+    Args:
+        assets (list): Asset instances
+    """
+    numbers = dict(
+        ExternalInventory.assets.through.objects.filter(asset_id__in=[asset.pk for asset in assets])
+        .exclude(externalinventory__inventory_number="")
+        .values("asset_id")
+        .annotate(
+            numbers=StringAgg(
+                "externalinventory__inventory_number",
+                delimiter=" ",
+                distinct=True,
+                ordering="externalinventory__inventory_number",
+            )
+        )
+        .values_list("asset_id", "numbers")
+    )
+    for asset in assets:
+        asset.external_inventory_numbers_for_search = numbers.get(asset.pk, "")
+
+
+def get_plugin_indexers():
+    """Get the registered search indexers of the plugin models, keyed by model label."""
+    return {label: indexer for label, indexer in registry["search"].items() if label.startswith("inventory_monitor.")}
+
+
+def cache_search_values(model, pks):
+    """
+    Rebuild the cached search values of a batch of objects.
+
+    Existing values of the batch are removed with one DELETE and the new values are
+    written with one bulk INSERT. Asset External Inventory numbers are precomputed for
+    the whole batch with one grouped query.
+
+    Args:
+        model: Plugin model class
+        pks (list): Primary keys of the objects in the batch
+
+    Returns:
+        int: Number of cached values written
+    """
+    indexer = get_plugin_indexers()[model._meta.label_lower]
+    object_type = ObjectType.objects.get_for_model(model)
+    custom_fields = list(CustomField.objects.filter(object_types=object_type).exclude(search_weight=0))
+
+    instances = list(model.objects.filter(pk__in=pks))
+    if model is Asset:
+        prefetch_external_inventory_numbers(instances)
+
+    cached_values = [
+        CachedValue(
+            object_type=object_type,
+            object_id=instance.pk,
+            field=field.name,
+            type=field.type,
+            weight=field.weight,
+            value=field.value,
+        )
+        for instance in instances
+        for field in indexer.to_cache(instance, custom_fields=custom_fields)
+    ]
+
+    with transaction.atomic():
+        CachedValue.objects.filter(object_type=object_type, object_id__in=pks).delete()
+        return len(CachedValue.objects.bulk_create(cached_values))
+
+
 @register_search
 class ContractIndex(SearchIndex):
     model = Contract
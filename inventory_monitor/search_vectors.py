@@ -0,0 +1,133 @@
+"""
+Full-text search support for Inventory Monitor Plugin.
+
+Asset, Probe and ExternalInventory carry an optional ``search_vector`` (tsvector)
+column. When the ``search_vector_enabled`` plugin setting is on, the column is kept
+up to date by signal handlers and the ``q`` filters of these models match against
+it instead of running substring scans. Existing rows can be (re)built with the
+``inventory_monitor_search_vectors`` management command.
+"""
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, Subquery
+
+from inventory_monitor.models import Asset, ExternalInventory, Probe
+
+# Serial numbers, part numbers and inventory numbers must not be stemmed
+SEARCH_CONFIG = "simple"
+
+
+def get_asset_search_vector():
+    """Build the search vector expression for Asset objects."""
+    inventory_numbers = (
+        ExternalInventory.assets.through.objects.filter(asset_id=OuterRef("pk"))
+        .values("asset_id")
+        .annotate(numbers=StringAgg("externalinventory__inventory_number", delimiter=" "))
+        .values("numbers")
+    )
+    return (
+        SearchVector("serial", "partnumber", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Subquery(inventory_numbers), weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+    )
+
+
+def get_probe_search_vector():
+    """Build the search vector expression for Probe objects."""
+    return (
+        SearchVector("serial", "part", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(
+            "name",
+            "device_descriptor",
+            "site_descriptor",
+            "location_descriptor",
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def get_external_inventory_search_vector():
+    """Build the search vector expression for ExternalInventory objects."""
+    return (
+        SearchVector("inventory_number", "serial_number", "external_id", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("name", weight="B", config=SEARCH_CONFIG)
+        # Matched by the non-vector search too, so enabling the vector drops no field
+        + SearchVector(
+            "person_id",
+            "person_name",
+            "location_code",
+            "location",
+            "department_code",
+            "project_code",
+            "user_name",
+            "user_note",
+            weight="C",
+            config=SEARCH_CONFIG,
+        )
+    )
+
+
+SEARCH_VECTORS = {
+    Asset: get_asset_search_vector,
+    Probe: get_probe_search_vector,
+    ExternalInventory: get_external_inventory_search_vector,
+}
+
+
+def update_search_vectors(queryset):
+    """
+    Recompute the search vector of all objects in the queryset with a single UPDATE.
+
+    Args:
+        queryset (QuerySet): Asset, Probe or ExternalInventory queryset
+
+    Returns:
+        int: Number of updated rows
+    """
+    return queryset.order_by().update(search_vector=SEARCH_VECTORS[queryset.model]())
+
+
+def get_search_query(value):
+    """
+    Build a prefix-matching tsquery requiring all terms of the given value.
+
+    Args:
+        value (str): Search term(s) as entered by the user
+
+    Returns:
+        SearchQuery: Query matching objects containing every term as a word prefix
+    """
+    terms = []
+    for term in value.split():
+        # Quote each term so tsquery operators in user input are taken literally
+        term = term.replace("\\", "\\\\").replace("'", "''")
+        terms.append(f"'{term}':*")
+    return SearchQuery(" & ".join(terms), search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_by_vector(queryset, value, other_ids=()):
+    """
+    Filter the queryset by its search vector and order the results by rank.
+
+    Args:
+        queryset (QuerySet): Asset, Probe or ExternalInventory queryset
+        value (str): Search term(s)
+        other_ids (list): Querysets of object IDs matched by sources outside the search
+            vector. They are combined with the vector match using UNION and rank last.
+
+    Returns:
+        QuerySet: Matching objects, best matches first
+    """
+    if not value.split():
+        return queryset
+
+    query = get_search_query(value)
+    if other_ids:
+        vector_ids = queryset.model.objects.filter(search_vector=query).values("pk").order_by()
+        queryset = queryset.filter(pk__in=vector_ids.union(*other_ids))
+    else:
+        queryset = queryset.filter(search_vector=query)
+    return queryset.annotate(search_rank=SearchRank(F("search_vector"), query)).order_by("-search_rank", "pk")
@@ -28,6 +28,106 @@ def get_probe_recent_days():
     return get_plugin_settings().get("probe_recent_days", 7)
 
 
+def get_expiry_warning_days():
+    """
+    Get the number of days before a warranty or service end in which it is "expiring".
+
+    Returns:
+        int: Number of days (default: 14)
+    """
+    return get_plugin_settings().get("expiry_warning_days", 14)
+
+
+def get_search_vector_enabled():
+    """
+    Check whether the full-text search vectors are maintained and used by the "q" filters.
+
+    Returns:
+        bool: True if enabled (default: False)
+    """
+    return get_plugin_settings().get("search_vector_enabled", False)
+
+
+def get_probe_payload_dedup():
+    """
+    Check whether the discovered data of saved and imported probes is stored in shared payloads.
+
+    Returns:
+        bool: True if enabled (default: False)
+    """
+    return get_plugin_settings().get("probe_payload_dedup", False)
+
+
+def get_probe_interval_max_gap_hours():
+    """
+    Get the longest gap in hours between observations of an item stored as one probe interval.
+
+    Returns:
+        int: Hours, 0 stores a probe per collector run (default: 0)
+    """
+    return get_plugin_settings().get("probe_interval_max_gap_hours", 0)
+
+
+def get_report_cache_timeout():
+    """
+    Get the number of seconds report results are cached for.
+
+    Returns:
+        int: Cache timeout in seconds (default: 3600)
+    """
+    return get_plugin_settings().get("report_cache_timeout", 3600)
+
+
+def get_contract_rollup_cache_timeout():
+    """
+    Get the number of seconds contract rollup totals are cached for on the contract page.
+
+    Returns:
+        int: Cache timeout in seconds, 0 disables caching (default: 0)
+    """
+    return get_plugin_settings().get("contract_rollup_cache_timeout", 0)
+
+
+def get_graphql_max_depth():
+    """
+    Get the maximum nesting depth of object fields in plugin GraphQL queries.
+
+    Returns:
+        int: Maximum depth, 0 disables the limit (default: 8)
+    """
+    return get_plugin_settings().get("graphql_max_depth", 8)
+
+
+def get_graphql_max_cost():
+    """
+    Get the maximum estimated cost (number of objects fetched) of plugin GraphQL queries.
+
+    Returns:
+        int: Maximum cost, 0 disables the limit (default: 50000)
+    """
+    return get_plugin_settings().get("graphql_max_cost", 50000)
+
+
+def get_graphql_default_list_size():
+    """
+    Get the number of objects assumed for lists queried without a pagination limit.
+
+    Returns:
+        int: Assumed list size (default: 1000)
+    """
+    return get_plugin_settings().get("graphql_default_list_size", 1000)
+
+
+def get_graphql_require_pagination():
+    """
+    Check if lists in plugin GraphQL queries (root lists and nested relations) must be paginated.
+
+    Returns:
+        bool: True if a pagination limit is required (default: True)
+    """
+    return get_plugin_settings().get("graphql_require_pagination", True)
+
+
 def get_external_inventory_status_config():
     """
     Get the external inventory status configuration.
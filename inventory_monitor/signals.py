@@ -0,0 +1,168 @@
+"""
+Signal handlers for Inventory Monitor Plugin.
+
+Connected from NetBoxInventoryMonitorConfig.ready().
+"""
+
+import threading
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from inventory_monitor.models import RMA, Asset, Contract, ExternalInventory, Invoice, Probe
+from inventory_monitor.reports import invalidate_contract_burndowns
+from inventory_monitor.search import cache_search_values
+from inventory_monitor.search_vectors import update_search_vectors
+from inventory_monitor.settings import get_search_vector_enabled
+
+
+def get_m2m_affected_asset_ids(instance, action, reverse, pk_set):
+    """
+    Get IDs of the assets whose External Inventory links are changed by an m2m_changed signal.
+
+    For "clear" actions the IDs are collected on "pre_clear" (while the links still exist)
+    and returned again on "post_clear".
+
+    Args:
+        instance: ExternalInventory (forward) or Asset (reverse) being changed
+        action (str): m2m_changed action
+        reverse (bool): True when the relation is changed from the Asset side
+        pk_set (set): Primary keys of the added/removed related objects
+
+    Returns:
+        set: Asset IDs
+    """
+    if reverse:
+        return {instance.pk}
+
+    if action == "pre_clear":
+        instance._cleared_asset_ids = set(instance.assets.values_list("pk", flat=True))
+        return instance._cleared_asset_ids
+    if action == "post_clear":
+        return getattr(instance, "_cleared_asset_ids", set())
+
+    return set(pk_set or ())
+
+
+# Asset IDs whose search values are re-cached on the next commit. Kept per thread, as
+# Django keeps a database connection per thread.
+pending_asset_search_cache = threading.local()
+
+
+def update_pending_asset_search_cache():
+    """on_commit callback re-caching the search values of all pending assets in one batch."""
+    asset_ids = getattr(pending_asset_search_cache, "asset_ids", None)
+    if not asset_ids:
+        return
+    pending_asset_search_cache.asset_ids = set()
+    cache_search_values(Asset, list(asset_ids))
+
+
+def schedule_asset_search_cache_update(asset_ids):
+    """
+    Re-cache the search values of the given assets once the current transaction commits.
+
+    The IDs are added to the pending set and a callback is registered. The first callback
+    to run after the commit re-caches every pending asset, the others find the set empty.
+    IDs added in a transaction that is rolled back are re-cached on the next commit.
+
+    Args:
+        asset_ids (set): Asset IDs
+    """
+    if not asset_ids:
+        return
+
+    if not hasattr(pending_asset_search_cache, "asset_ids"):
+        pending_asset_search_cache.asset_ids = set()
+    pending_asset_search_cache.asset_ids.update(asset_ids)
+    transaction.on_commit(update_pending_asset_search_cache)
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=Probe)
+@receiver(post_save, sender=ExternalInventory)
+def update_search_vector(sender, instance, raw=False, **kwargs):
+    """Refresh the full-text search vector of a saved object."""
+    if raw or not get_search_vector_enabled():
+        return
+
+    update_search_vectors(sender.objects.filter(pk=instance.pk))
+
+    # Inventory number is part of the search vector of linked assets
+    if sender is ExternalInventory:
+        update_search_vectors(Asset.objects.filter(external_inventory_items=instance))
+
+
+@receiver(m2m_changed, sender=ExternalInventory.assets.through)
+def update_asset_search_vectors(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the search vectors of assets linked to or unlinked from External Inventory items."""
+    if action not in ("post_add", "post_remove", "pre_clear", "post_clear") or not get_search_vector_enabled():
+        return
+
+    asset_ids = get_m2m_affected_asset_ids(instance, action, reverse, pk_set)
+    if action != "pre_clear" and asset_ids:
+        update_search_vectors(Asset.objects.filter(pk__in=asset_ids))
+
+
+@receiver(m2m_changed, sender=ExternalInventory.assets.through)
+def update_asset_search_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    """Re-cache the search values of assets linked to or unlinked from External Inventory items."""
+    if action not in ("post_add", "post_remove", "pre_clear", "post_clear"):
+        return
+
+    asset_ids = get_m2m_affected_asset_ids(instance, action, reverse, pk_set)
+    if action != "pre_clear":
+        schedule_asset_search_cache_update(asset_ids)
+
+
+@receiver(post_save, sender=ExternalInventory)
+def update_linked_asset_search_cache(sender, instance, created, raw=False, **kwargs):
+    """Re-cache the search values of assets linked to a changed External Inventory item."""
+    if raw or created:
+        return
+
+    schedule_asset_search_cache_update(set(instance.assets.values_list("pk", flat=True)))
+
+
+@receiver(pre_delete, sender=ExternalInventory)
+def update_unlinked_asset_search_cache(sender, instance, **kwargs):
+    """Re-cache the search values of assets linked to an External Inventory item being deleted."""
+    schedule_asset_search_cache_update(set(instance.assets.values_list("pk", flat=True)))
+
+
+@receiver(post_init, sender=Invoice)
+def remember_invoice_contract(sender, instance, **kwargs):
+    """Remember the loaded contract, so moving an invoice also invalidates its previous contract."""
+    instance._loaded_contract_id = instance.contract_id
+
+
+@receiver(post_init, sender=Contract)
+def remember_contract_parent(sender, instance, **kwargs):
+    """Remember the loaded parent, so moving a subcontract also invalidates its previous parent."""
+    instance._loaded_parent_id = instance.parent_id
+
+
+@receiver(post_init, sender=RMA)
+def remember_rma_status(sender, instance, **kwargs):
+    """Remember the loaded status, so RMA.save() detects a completion without reading the RMA again."""
+    # A deferred status is not loaded here, RMA.save() reads it only when needed
+    instance._loaded_status = instance.__dict__.get("status") if instance.pk else None
+
+
+@receiver(post_save, sender=Invoice)
+@receiver(post_delete, sender=Invoice)
+def invalidate_invoice_contract_burndown(sender, instance, **kwargs):
+    """Drop cached burn-downs of the contracts an invoice belongs or belonged to."""
+    contract_ids = {instance.contract_id, instance._loaded_contract_id}
+    instance._loaded_contract_id = instance.contract_id
+    transaction.on_commit(lambda: invalidate_contract_burndowns(contract_ids))
+
+
+@receiver(post_save, sender=Contract)
+@receiver(post_delete, sender=Contract)
+def invalidate_contract_burndown(sender, instance, **kwargs):
+    """Drop cached burn-downs of a changed contract and of its current and previous parent."""
+    contract_ids = {instance.pk, instance.parent_id, instance._loaded_parent_id}
+    instance._loaded_parent_id = instance.parent_id
+    transaction.on_commit(lambda: invalidate_contract_burndowns(contract_ids))
@@ -7,7 +7,7 @@ from inventory_monitor.helpers import (
     TEMPLATE_SERVICES_END,
     NumberColumn,
 )
-from inventory_monitor.models import Asset
+from inventory_monitor.models import Asset, annotate_date_status, get_date_status_order
 
 
 def _should_highlight_device_serial_match(record, table):
@@ -119,7 +119,7 @@ class AssetTable(NetBoxTable):
             {% include 'inventory_monitor/inc/status_badge.html' with status_type='warranty' %}
         """,
         verbose_name="Warranty Status",
-        orderable=False,
+        orderable=True,
     )
 
     #
@@ -165,6 +165,15 @@ class AssetTable(NetBoxTable):
     tags = columns.TagColumn()
     comments = tables.Column()
 
+    def order_warranty_status(self, queryset, is_descending):
+        """Order by warranty status urgency (expired first), then by warranty end."""
+        queryset = annotate_date_status(queryset, "warranty_start", "warranty_end", "warranty_state")
+        prefix = "-" if is_descending else ""
+        queryset = queryset.annotate(warranty_state_order=get_date_status_order("warranty_state")).order_by(
+            f"{prefix}warranty_state_order", f"{prefix}warranty_end"
+        )
+        return queryset, True
+
     class Meta(NetBoxTable.Meta):
         model = Asset
 
@@ -2,7 +2,7 @@ import django_tables2 as tables
 from netbox.tables import NetBoxTable, columns
 
 from inventory_monitor.helpers import NumberColumn
-from inventory_monitor.models import AssetService
+from inventory_monitor.models import AssetService, annotate_date_status, get_date_status_order
 
 
 class AssetServiceTable(NetBoxTable):
@@ -14,10 +14,19 @@ class AssetServiceTable(NetBoxTable):
             {% include 'inventory_monitor/inc/status_badge.html' with status_type='service' %}
         """,
         verbose_name="Service Status",
-        orderable=False,
+        orderable=True,
     )
     tags = columns.TagColumn()
 
+    def order_service_status(self, queryset, is_descending):
+        """Order by service status urgency (expired first), then by service end."""
+        queryset = annotate_date_status(queryset, "service_start", "service_end", "service_state")
+        prefix = "-" if is_descending else ""
+        queryset = queryset.annotate(service_state_order=get_date_status_order("service_state")).order_by(
+            f"{prefix}service_state_order", f"{prefix}service_end"
+        )
+        return queryset, True
+
     class Meta(NetBoxTable.Meta):
         model = AssetService
         fields = (
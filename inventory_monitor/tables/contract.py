@@ -1,7 +1,7 @@
 import django_tables2 as tables
 from netbox.tables import ChoiceFieldColumn, NetBoxTable, columns
 
-from inventory_monitor.helpers import NumberColumn
+from inventory_monitor.helpers import AttachmentsCountColumn, NumberColumn
 from inventory_monitor.models import Contract
 
 
@@ -11,10 +11,14 @@ class ContractTable(NetBoxTable):
     subcontracts_count = tables.Column()
     invoices_count = tables.Column()
     contract_type = tables.Column(orderable=False)
-    attachments_count = tables.Column()
+    attachments_count = AttachmentsCountColumn()
     parent = tables.Column(linkify=True)
     type = ChoiceFieldColumn()
     price = NumberColumn()
+    rollup_invoiced = NumberColumn(verbose_name="Total Invoiced")
+    rollup_assets_count = tables.Column(verbose_name="Total Assets")
+    rollup_assets_value = NumberColumn(verbose_name="Total Assets Value")
+    rollup_services_cost = NumberColumn(verbose_name="Total Services Cost")
     tags = columns.TagColumn()
 
     class Meta(NetBoxTable.Meta):
@@ -37,6 +41,10 @@ class ContractTable(NetBoxTable):
             "invoices_count",
             "subcontracts_count",
             "attachments_count",
+            "rollup_invoiced",
+            "rollup_assets_count",
+            "rollup_assets_value",
+            "rollup_services_cost",
             "actions",
         )
         default_columns = (
@@ -1,7 +1,7 @@
 import django_tables2 as tables
 from netbox.tables import NetBoxTable, columns
 
-from inventory_monitor.helpers import NumberColumn
+from inventory_monitor.helpers import AttachmentsCountColumn, NumberColumn
 from inventory_monitor.models import Invoice
 
 
@@ -9,7 +9,7 @@ class InvoiceTable(NetBoxTable):
     name = tables.Column(linkify=True, verbose_name="Invoice Number")
     name_internal = tables.Column(verbose_name="Internal ID")
     contract = tables.Column(linkify=True)
-    attachments_count = tables.Column()
+    attachments_count = AttachmentsCountColumn()
     price = NumberColumn()
     tags = columns.TagColumn()
 
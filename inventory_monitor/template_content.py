@@ -20,7 +20,9 @@ from netbox.views import generic
 from utilities.views import ViewTab, register_model_view
 
 from inventory_monitor.filtersets import AssetFilterSet, ProbeFilterSet
-from inventory_monitor.models import Asset, Contract, Contractor, Probe
+from inventory_monitor.filtersets.rma import get_rma_ids_by_serial
+from inventory_monitor.helpers import get_content_type, prefetch_assigned_objects
+from inventory_monitor.models import RMA, Asset, Contract, Contractor, Probe
 from inventory_monitor.tables import EnhancedAssetTable, EnhancedProbeTable
 
 # Load plugin configuration settings
@@ -99,9 +101,10 @@ class ProbeAssetExtension(PluginTemplateExtension):
         # 1. Current asset serial matches probe serial
         # 2. Asset has an RMA where original_serial matches probe serial
         # 3. Asset has an RMA where replacement_serial matches probe serial
-        matching_assets = Asset.objects.filter(
-            Q(serial=probe.serial) | Q(rmas__original_serial=probe.serial) | Q(rmas__replacement_serial=probe.serial)
-        ).distinct()
+        rma_asset_ids = RMA.objects.filter(pk__in=get_rma_ids_by_serial(probe.serial)).values("asset_id")
+        matching_assets = prefetch_assigned_objects(
+            Asset.objects.filter(Q(serial=probe.serial) | Q(pk__in=rma_asset_ids))
+        )
 
         # Create asset table for display with limited columns for cleaner view
         asset_table = EnhancedAssetTable(matching_assets)
@@ -182,11 +185,9 @@ class AssetDuplicates(PluginTemplateExtension):
         # Find assets that have this serial in their RMAs
         if current_asset.serial:
             rma_dups = (
-                Asset.objects.filter(
-                    Q(rmas__original_serial=current_asset.serial) | Q(rmas__replacement_serial=current_asset.serial)
-                )
-                .exclude(id=current_asset.id)
-                .values_list("id", flat=True)
+                RMA.objects.filter(pk__in=get_rma_ids_by_serial(current_asset.serial))
+                .exclude(asset_id=current_asset.id)
+                .values_list("asset_id", flat=True)
                 .distinct()
             )
 
@@ -334,7 +335,7 @@ class ContractAssetsView(generic.ObjectChildrenView):
 
     def get_children(self, request: HttpRequest, parent: Contract) -> QuerySet[Asset]:
         """Get assets where this contract is the order_contract."""
-        return parent.assets.all()
+        return prefetch_assigned_objects(parent.assets.all())
 
 
 class AssignedAssetsView(generic.ObjectChildrenView):
@@ -365,7 +366,7 @@ class AssignedAssetsView(generic.ObjectChildrenView):
         Returns:
             Set of asset IDs including direct and hierarchical assignments
         """
-        content_type = ContentType.objects.get_for_model(parent)
+        content_type = get_content_type(parent)
 
         # Start with assets directly assigned to this object
         asset_ids = set(
@@ -399,9 +400,9 @@ class AssignedAssetsView(generic.ObjectChildrenView):
         """
         if not AssignedAssetsView._content_types:
             AssignedAssetsView._content_types = {
-                "location": ContentType.objects.get_for_model(Location),
-                "device": ContentType.objects.get_for_model(Device),
-                "module": ContentType.objects.get_for_model(Module),
+                "location": get_content_type(Location),
+                "device": get_content_type(Device),
+                "module": get_content_type(Module),
             }
         return AssignedAssetsView._content_types
 
@@ -540,7 +541,7 @@ class AssignedAssetsView(generic.ObjectChildrenView):
             QuerySet of assets including hierarchical relationships
         """
         asset_ids = self.get_hierarchical_asset_ids(parent)
-        return Asset.objects.filter(id__in=asset_ids)
+        return prefetch_assigned_objects(Asset.objects.filter(id__in=asset_ids))
 
 
 def asset_view_for_model(model: Type) -> Type:
@@ -1,5 +1,4 @@
 from django import template
-from django.contrib.contenttypes.models import ContentType
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 
@@ -57,9 +56,8 @@ def get_content_type_param(obj):
     if obj is None:
         return None
 
-    # Get the model name in lowercase
-    content_type = ContentType.objects.get_for_model(obj)
-    model_name = content_type.model.lower()
+    # Model name in lowercase, as stored in its ContentType (no lookup needed)
+    model_name = obj._meta.concrete_model._meta.model_name
 
     # You can customize this mapping if needed
     param_mapping = {
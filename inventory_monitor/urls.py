@@ -10,6 +10,7 @@ urlpatterns = (
     ## Probes
     path("probes/", views.ProbeListView.as_view(), name="probe_list"),
     path("probes/add/", views.ProbeEditView.as_view(), name="probe_add"),
+    path("probes/import/", views.ProbeImportView.as_view(), name="probe_import"),
     path("probes/<int:pk>/", views.ProbeView.as_view(), name="probe"),
     path("probes/<int:pk>/edit/", views.ProbeEditView.as_view(), name="probe_edit"),
     path("probes/<int:pk>/delete/", views.ProbeDeleteView.as_view(), name="probe_delete"),
@@ -36,6 +37,11 @@ urlpatterns = (
     ),
     ## Probe Diff
     path("probe_diff/", views.ProbeDiffView.as_view(), name="probediff"),
+    ## Import jobs
+    path("import-jobs/<int:pk>/", views.ImportJobView.as_view(), name="import_job"),
+    ## Reports
+    path("reports/expiry-forecast/", views.ExpiryForecastView.as_view(), name="expiry_forecast"),
+    path("reports/rma-failure-rates/", views.RMAFailureRateView.as_view(), name="rma_failure_rates"),
     ## Contracts
     path("contracts/", include(get_model_urls("inventory_monitor", "contract", detail=False))),
     path("contracts/<int:pk>/", include(get_model_urls("inventory_monitor", "contract"))),
@@ -8,6 +8,7 @@ from inventory_monitor.views.asset import (
     AssetBulkDeleteView,
     AssetBulkImportView,
     AssetExternalInventoryAssignmentView,
+    AssetFastImportView,
 )
 
 # Asset Service views
@@ -59,6 +60,7 @@ from inventory_monitor.views.external_inventory import (
     ExternalInventoryDeleteView,
     ExternalInventoryBulkEditView,
     ExternalInventoryBulkDeleteView,
+    ExternalInventorySyncView,
 )
 
 # Invoice views
@@ -79,6 +81,18 @@ from inventory_monitor.views.probe import (
     ProbeDeleteView,
     ProbeBulkDeleteView,
     ProbeDiffView,
+    ProbeImportView,
+)
+
+# Import views
+from inventory_monitor.views.imports import (
+    ImportJobView,
+)
+
+# Report views
+from inventory_monitor.views.reports import (
+    ExpiryForecastView,
+    RMAFailureRateView,
 )
 
 # RMA views
@@ -89,6 +103,7 @@ from inventory_monitor.views.rma import (
     RMADeleteView,
     RMABulkEditView,
     RMABulkDeleteView,
+    RMABulkCompleteView,
 )
 
 # Define __all__ to explicitly list what should be available when importing from this module
@@ -102,6 +117,7 @@ __all__ = [
     "AssetBulkDeleteView",
     "AssetBulkImportView",
     "AssetExternalInventoryAssignmentView",
+    "AssetFastImportView",
     # Asset Service views
     "AssetServiceView",
     "AssetServiceListView",
@@ -138,6 +154,7 @@ __all__ = [
     "ExternalInventoryDeleteView",
     "ExternalInventoryBulkEditView",
     "ExternalInventoryBulkDeleteView",
+    "ExternalInventorySyncView",
     # Invoice views
     "InvoiceView",
     "InvoiceListView",
@@ -152,6 +169,12 @@ __all__ = [
     "ProbeDeleteView",
     "ProbeBulkDeleteView",
     "ProbeDiffView",
+    "ProbeImportView",
+    # Import views
+    "ImportJobView",
+    # Report views
+    "ExpiryForecastView",
+    "RMAFailureRateView",
     # RMA views
     "RMAView",
     "RMAListView",
@@ -159,4 +182,5 @@ __all__ = [
     "RMADeleteView",
     "RMABulkEditView",
     "RMABulkDeleteView",
+    "RMABulkCompleteView",
 ]
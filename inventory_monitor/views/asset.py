@@ -1,7 +1,7 @@
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.postgres.aggregates.general import ArrayAgg
-from django.db.models import Count
+from django.db.models import Count, Max, Min, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.translation import gettext as _
@@ -10,7 +10,22 @@ from utilities.views import register_model_view
 
 from inventory_monitor import filtersets, forms, models, tables
 from inventory_monitor.forms.asset import AssetExternalInventoryAssignmentForm
+from inventory_monitor.helpers import prefetch_assigned_objects
+from inventory_monitor.importers import AssetImporter
+from inventory_monitor.jobs import AssetImportJob
 from inventory_monitor.models import Asset
+from inventory_monitor.views.imports import BaseImportView
+
+
+def get_services_summary_subquery(aggregate):
+    """Build a correlated subquery aggregating the services of each asset, without joining them into the list query."""
+    return Subquery(
+        models.AssetService.objects.filter(asset=OuterRef("pk"))
+        .order_by()
+        .values("asset")
+        .annotate(summary=aggregate)
+        .values("summary")
+    )
 
 
 @register_model_view(models.Asset)
@@ -21,16 +36,17 @@ class AssetView(generic.ObjectView):
 @register_model_view(models.Asset, 'list', path='', detail=False)
 class AssetListView(generic.ObjectListView):
     queryset = (
-        models.Asset.objects.all()
-        .prefetch_related("services")
+        prefetch_assigned_objects(models.Asset.objects.all())  # Optimize generic foreign key queries
+        # Services columns render from the prefetch, contracts are joined in the same query
+        .prefetch_related(Prefetch("services", queryset=models.AssetService.objects.select_related("contract")))
         .prefetch_related("tags")
         .prefetch_related("external_inventory_items")
         .prefetch_related("rmas")  # Prefetch RMAs to avoid N+1 queries in get_related_probes
         .prefetch_related("type")  # Prefetch asset types for table display
-        .select_related("assigned_object_type")  # Optimize generic foreign key queries
-        .annotate(services_count=Count("services"))
-        .annotate(services_to=ArrayAgg("services__service_end"))
-        .annotate(services_contracts=ArrayAgg("services__contract__name"))
+        # Scalar per-asset summaries, used for the services columns and their ordering
+        .annotate(services_count=Coalesce(get_services_summary_subquery(Count("pk")), Value(0)))
+        .annotate(services_to=get_services_summary_subquery(Max("service_end")))
+        .annotate(services_contracts=get_services_summary_subquery(Min("contract__name")))
     )
     filterset = filtersets.AssetFilterSet
     filterset_form = forms.AssetFilterForm
@@ -43,6 +59,12 @@ class AssetListView(generic.ObjectListView):
         "bulk_delete": {"delete"},
     }
 
+    def get_queryset(self, request):
+        # Annotated per request, the status buckets depend on the current date
+        return models.annotate_date_status(
+            super().get_queryset(request), "warranty_start", "warranty_end", "warranty_state"
+        )
+
 
 @register_model_view(models.Asset, 'add', detail=False)
 @register_model_view(models.Asset, 'edit')
@@ -69,7 +91,7 @@ class AssetDeleteView(generic.ObjectDeleteView):
 
 @register_model_view(models.Asset, 'bulk_edit', path='edit', detail=False)
 class AssetBulkEditView(generic.BulkEditView):
-    queryset = models.Asset.objects.all()
+    queryset = prefetch_assigned_objects(models.Asset.objects.all())
     filterset = filtersets.AssetFilterSet
     table = tables.EnhancedAssetTable
     form = forms.AssetBulkEditForm
@@ -89,6 +111,19 @@ class AssetBulkImportView(generic.BulkImportView):
     model_form = forms.AssetBulkImportForm
 
 
+@register_model_view(models.Asset, 'fast_import', path='import-fast', detail=False)
+class AssetFastImportView(BaseImportView):
+    """
+    Import large CSV files through the bulk import fast path (see inventory_monitor.importers)
+    """
+
+    permission_required = "inventory_monitor.add_asset"
+    form = forms.AssetFastImportForm
+    importer_class = AssetImporter
+    job_class = AssetImportJob
+    template_name = "inventory_monitor/asset_fast_import.html"
+
+
 @register_model_view(models.Asset, 'external_inventory_assignment', path='assign-external-inventory')
 class AssetExternalInventoryAssignmentView(generic.ObjectEditView):
     """
@@ -16,6 +16,12 @@ class AssetServiceListView(generic.ObjectListView):
     filterset_form = forms.AssetServiceFilterForm
     table = tables.AssetServiceTable
 
+    def get_queryset(self, request):
+        # Annotated per request, the status buckets depend on the current date
+        return models.annotate_date_status(
+            super().get_queryset(request), "service_start", "service_end", "service_state"
+        )
+
 
 @register_model_view(models.AssetService, 'add')
 class AssetServiceCreateView(generic.ObjectEditView):
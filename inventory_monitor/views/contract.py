@@ -1,46 +1,15 @@
-from core.models import ObjectType
-from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models import Count
 from netbox.views import generic
 from utilities.views import register_model_view
 
 from inventory_monitor import filtersets, forms, models, tables
-from inventory_monitor.helpers import get_object_type_or_none
-
-# Attempt to import NetBoxAttachment and set a flag based on its availability
-attachments_model_exists = False
-try:
-    from netbox_attachments.models import NetBoxAttachment
-
-    attachments_model_exists = True
-except (ModuleNotFoundError, RuntimeError):
-    pass
-
-
-def get_attachments_count_query(model_name):
-    if not attachments_model_exists:
-        return Value(0)
-
-    object_type = get_object_type_or_none(app_label="inventory_monitor", model=model_name)
-
-    if not object_type:
-        return Value(0)
-
-    try:
-        return Subquery(
-            NetBoxAttachment.objects.filter(object_id=OuterRef("id"), object_type=object_type)
-            .values("object_id")
-            .annotate(attachments_count=Count("*"))
-            .values("attachments_count")
-        )
-    except (ObjectType.DoesNotExist, ValueError):
-        return Value(0)
-
+from inventory_monitor.reports import annotate_contract_rollups, get_cached_contract_burndown, get_contract_rollups
 
 def annotate_queryset_with_counts(queryset):
+    # Attachment counts are fetched per table page by AttachmentsCountColumn
     queryset = queryset.annotate(
         subcontracts_count=Count("subcontracts", distinct=True),
         invoices_count=Count("invoices", distinct=True),
-        attachments_count=get_attachments_count_query("contract"),
     )
     return queryset
 
@@ -49,6 +18,14 @@ def annotate_queryset_with_counts(queryset):
 class ContractView(generic.ObjectView):
     queryset = annotate_queryset_with_counts(models.Contract.objects.all())
 
+    def get_extra_context(self, request, instance):
+        return {
+            "rollups": get_contract_rollups(instance, request.user),
+            "burndown": get_cached_contract_burndown(
+                request.user, instance, models.Invoice.objects.restrict(request.user, "view")
+            ),
+        }
+
 
 @register_model_view(models.Contract, 'list', path='', detail=False)
 class ContractListView(generic.ObjectListView):
@@ -63,6 +40,10 @@ class ContractListView(generic.ObjectListView):
         "bulk_delete": {"delete"},
     }
 
+    def get_queryset(self, request):
+        # Annotated per request, the totals only count objects the user may view
+        return annotate_contract_rollups(super().get_queryset(request), request.user)
+
 
 @register_model_view(models.Contract, 'add', detail=False)
 @register_model_view(models.Contract, 'edit')
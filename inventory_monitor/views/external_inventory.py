@@ -2,9 +2,17 @@ from netbox.views import generic
 from utilities.views import register_model_view
 
 from inventory_monitor.filtersets import ExternalInventoryFilterSet
-from inventory_monitor.forms import ExternalInventoryFilterForm, ExternalInventoryForm, ExternalInventoryBulkEditForm
+from inventory_monitor.forms import (
+    ExternalInventoryBulkEditForm,
+    ExternalInventoryFilterForm,
+    ExternalInventoryForm,
+    ExternalInventorySyncForm,
+)
+from inventory_monitor.importers import ExternalInventorySync
+from inventory_monitor.jobs import ExternalInventorySyncJob
 from inventory_monitor.models import ExternalInventory
 from inventory_monitor.tables import ExternalInventoryTable
+from inventory_monitor.views.imports import BaseImportView
 
 
 @register_model_view(ExternalInventory)
@@ -18,6 +26,7 @@ class ExternalInventoryListView(generic.ObjectListView):
     table = ExternalInventoryTable
     filterset = ExternalInventoryFilterSet
     filterset_form = ExternalInventoryFilterForm
+    template_name = "inventory_monitor/externalinventory_list.html"
     actions = {
         "add": {"add"},
         "export": set(),
@@ -52,3 +61,16 @@ class ExternalInventoryBulkDeleteView(generic.BulkDeleteView):
     filterset = ExternalInventoryFilterSet
     table = ExternalInventoryTable
     default_return_url = "plugins:inventory_monitor:externalinventory_list"
+
+
+@register_model_view(ExternalInventory, 'sync', path='sync', detail=False)
+class ExternalInventorySyncView(BaseImportView):
+    """
+    Synchronize External Inventory items with a CSV export of the external system
+    """
+
+    permission_required = ("inventory_monitor.add_externalinventory", "inventory_monitor.change_externalinventory")
+    form = ExternalInventorySyncForm
+    importer_class = ExternalInventorySync
+    job_class = ExternalInventorySyncJob
+    template_name = "inventory_monitor/externalinventory_sync.html"
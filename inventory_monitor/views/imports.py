@@ -0,0 +1,84 @@
+from core.models import Job
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.http import Http404
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.translation import gettext as _
+from django.views.generic import View
+from utilities.htmx import htmx_partial
+
+from inventory_monitor.importers import IMPORT_BATCH_SIZE, parse_csv, store_import_file
+from inventory_monitor.jobs import AssetImportJob, ExternalInventorySyncJob, ProbeImportJob
+
+IMPORT_JOB_NAMES = [job_class.name for job_class in (AssetImportJob, ProbeImportJob, ExternalInventorySyncJob)]
+
+
+class BaseImportView(PermissionRequiredMixin, View):
+    """
+    Import a CSV file with a bulk importer (see inventory_monitor.importers), either as a
+    background job or within the request.
+    """
+
+    form = None
+    importer_class = None
+    job_class = None
+    template_name = None
+
+    def get(self, request):
+        return render(request, self.template_name, {"form": self.form()})
+
+    def post(self, request):
+        form = self.form(request.POST, request.FILES)
+        importer = None
+
+        if form.is_valid():
+            batch_size = form.cleaned_data["batch_size"] or IMPORT_BATCH_SIZE
+
+            if form.cleaned_data["background_job"]:
+                file_name = store_import_file(form.cleaned_data["upload_file"], form.cleaned_data["data"])
+                job = self.job_class.enqueue(
+                    user=request.user,
+                    file_name=file_name,
+                    batch_size=batch_size,
+                    request_id=str(request.id),
+                )
+                messages.info(request, _("Import enqueued as background job {}").format(job.pk))
+                return redirect("plugins:inventory_monitor:import_job", pk=job.pk)
+
+            importer = self.importer_class(request.user, request_id=request.id, batch_size=batch_size).run(
+                parse_csv(form.read_data())
+            )
+            if importer.created or importer.updated:
+                messages.success(
+                    request,
+                    _("Created {} and updated {} object(s)").format(len(importer.created), len(importer.updated)),
+                )
+            if importer.errors:
+                messages.warning(request, _("{} row(s) were not imported").format(len(importer.errors)))
+
+        return render(request, self.template_name, {"form": form, "importer": importer})
+
+
+class ImportJobView(LoginRequiredMixin, View):
+    """
+    Progress of an import job. While the job runs, the status panel polls this view (htmx)
+    and is replaced with the current status.
+    """
+
+    template_name = "inventory_monitor/import_job.html"
+
+    def get(self, request, pk):
+        job = get_object_or_404(Job, pk=pk, name__in=IMPORT_JOB_NAMES)
+        if job.user != request.user and not request.user.is_superuser:
+            raise Http404
+
+        status = job.data or {}
+        context = {
+            "job": job,
+            "status": status,
+            "percent": int(100 * status["processed"] / status["rows"]) if status.get("rows") else 0,
+        }
+        if htmx_partial(request):
+            return render(request, "inventory_monitor/inc/import_job_status.html", context)
+        return render(request, self.template_name, context)
+
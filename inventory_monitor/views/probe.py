@@ -4,6 +4,10 @@ from django.views.generic import View
 from netbox.views import generic
 
 from inventory_monitor import filtersets, forms, models, tables
+from inventory_monitor.importers import ProbeImporter
+from inventory_monitor.jobs import ProbeImportJob
+from inventory_monitor.probe_intervals import get_probe_interval_max_gap
+from inventory_monitor.views.imports import BaseImportView
 
 
 class ProbeView(generic.ObjectView):
@@ -14,7 +18,7 @@ class ProbeListView(generic.ObjectListView):
     sub_count_serial = (
         models.Probe.objects.filter(serial=OuterRef("serial")).values("serial").annotate(changes_count=Count("*"))
     )
-    queryset = models.Probe.objects.prefetch_related("tags", "device").annotate(
+    queryset = models.Probe.objects.prefetch_related("tags", "device", "payload").annotate(
         changes_count=Subquery(sub_count_serial.values("changes_count"))
     )
 
@@ -38,6 +42,23 @@ class ProbeDeleteView(generic.ObjectDeleteView):
     queryset = models.Probe.objects.all()
 
 
+class ProbeImportView(BaseImportView):
+    """
+    Import probe data from CSV files through the bulk import fast path (see inventory_monitor.importers)
+    """
+
+    form = forms.ProbeImportForm
+    importer_class = ProbeImporter
+    job_class = ProbeImportJob
+    template_name = "inventory_monitor/probe_import.html"
+
+    def get_permission_required(self):
+        # With probe intervals the import extends existing probes
+        if get_probe_interval_max_gap():
+            return ("inventory_monitor.add_probe", "inventory_monitor.change_probe")
+        return ("inventory_monitor.add_probe",)
+
+
 class ProbeBulkDeleteView(generic.BulkDeleteView):
     queryset = models.Probe.objects.all()
     filterset = filtersets.ProbeFilterSet
@@ -0,0 +1,90 @@
+import csv
+
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.views.generic import View
+
+from inventory_monitor import forms, models
+from inventory_monitor.reports import (
+    EXPIRY_FORECAST_COLUMNS,
+    RMA_FAILURE_RATE_COLUMNS,
+    get_cached_expiry_forecast,
+    get_cached_rma_failure_rates,
+)
+
+
+class ExpiryForecastView(PermissionRequiredMixin, View):
+    """Monthly forecast of expiring warranties and services, exportable as CSV."""
+
+    permission_required = ("inventory_monitor.view_asset", "inventory_monitor.view_assetservice")
+
+    def get(self, request):
+        form = forms.ExpiryForecastForm(request.GET or None)
+        group_by, months = "vendor", 12
+        if form.is_valid():
+            group_by = form.cleaned_data["group_by"] or group_by
+            months = form.cleaned_data["months"] or months
+
+        rows = get_cached_expiry_forecast(
+            request.user,
+            models.Asset.objects.restrict(request.user, "view"),
+            models.AssetService.objects.restrict(request.user, "view"),
+            group_by=group_by,
+            months=months,
+        )
+
+        if request.GET.get("export") == "csv":
+            response = HttpResponse(content_type="text/csv")
+            response["Content-Disposition"] = f'attachment; filename="expiry_forecast_{group_by}.csv"'
+            writer = csv.DictWriter(response, fieldnames=EXPIRY_FORECAST_COLUMNS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({**row, "month": row["month"].strftime("%Y-%m")})
+            return response
+
+        return render(
+            request,
+            "inventory_monitor/expiry_forecast.html",
+            {
+                "form": form,
+                "rows": rows,
+                "group_by": group_by,
+                "months": months,
+            },
+        )
+
+
+class RMAFailureRateView(PermissionRequiredMixin, View):
+    """RMA counts and rates per vendor, part number and asset type, exportable as CSV."""
+
+    permission_required = ("inventory_monitor.view_asset", "inventory_monitor.view_rma")
+
+    def get(self, request):
+        form = forms.RMAFailureRateForm(request.GET or None)
+        since = form.cleaned_data["since"] if form.is_valid() else None
+
+        rows = get_cached_rma_failure_rates(
+            request.user,
+            models.Asset.objects.restrict(request.user, "view"),
+            models.RMA.objects.restrict(request.user, "view"),
+            since=since,
+        )
+
+        if request.GET.get("export") == "csv":
+            response = HttpResponse(content_type="text/csv")
+            response["Content-Disposition"] = 'attachment; filename="rma_failure_rates.csv"'
+            writer = csv.DictWriter(response, fieldnames=RMA_FAILURE_RATE_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+            return response
+
+        return render(
+            request,
+            "inventory_monitor/rma_failure_rates.html",
+            {
+                "form": form,
+                "rows": rows,
+                "since": since,
+            },
+        )
@@ -1,7 +1,13 @@
+from django.contrib import messages
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.shortcuts import redirect
+from django.utils.translation import gettext as _
+from django.views.generic import View
 from netbox.views import generic
-from utilities.views import register_model_view
+from utilities.views import GetReturnURLMixin, register_model_view
 
 from inventory_monitor import filtersets, forms, models, tables
+from inventory_monitor.rma_completion import complete_rmas, enqueue_update_events
 
 
 @register_model_view(models.RMA)
@@ -15,6 +21,7 @@ class RMAListView(generic.ObjectListView):
     table = tables.RMATable
     filterset = filtersets.RMAFilterSet
     filterset_form = forms.RMAFilterForm
+    template_name = "inventory_monitor/rma_list.html"
     actions = {
         "add": {"add"},
         "export": set(),
@@ -49,3 +56,31 @@ class RMABulkDeleteView(generic.BulkDeleteView):
     filterset = filtersets.RMAFilterSet
     table = tables.RMATable
     default_return_url = "plugins:inventory_monitor:rma_list"
+
+
+@register_model_view(models.RMA, 'bulk_complete', path='complete', detail=False)
+class RMABulkCompleteView(GetReturnURLMixin, PermissionRequiredMixin, View):
+    """
+    Complete the selected RMAs and apply their replacement serials to the assets in bulk
+    (see inventory_monitor.rma_completion). Update events of the RMAs and changed assets are
+    queued for event rules and webhooks, as the bulk edit does.
+    """
+
+    permission_required = ("inventory_monitor.change_rma", "inventory_monitor.change_asset")
+    default_return_url = "plugins:inventory_monitor:rma_list"
+
+    def post(self, request):
+        rmas = models.RMA.objects.restrict(request.user, "change").filter(pk__in=request.POST.getlist("pk"))
+
+        # Completing an RMA changes the serial of its asset, skip assets the user may not change
+        assets = models.Asset.objects.restrict(request.user, "change")
+        skipped = rmas.exclude(asset__in=assets).count()
+        completed, changed_assets = complete_rmas(rmas.filter(asset__in=assets), request.user, request_id=request.id)
+        enqueue_update_events(request, [*completed, *changed_assets])
+
+        messages.success(request, _("Completed {} RMA(s)").format(len(completed)))
+        if skipped:
+            messages.warning(
+                request, _("Skipped {} RMA(s) whose asset you do not have permission to change").format(skipped)
+            )
+        return redirect(self.get_return_url(request))